@@ -4,15 +4,43 @@ API Middleware - Request processing pipeline
 Handles authentication, rate limiting, CORS, and request validation.
 """
 
-from typing import Callable, Dict, List, Optional, Any
-import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple, Any
+from time import monotonic as _now
+from uuid import uuid4
+import sys
+import math
 import logging
 import json
 
-from .routes import Request, Response, HttpMethod
+from .routes import Request, Response
 
 logger = logging.getLogger(__name__)
 
+# Request header names, lower-cased to match Request.headers
+_H_AUTHORIZATION = sys.intern("authorization")
+_H_API_KEY = sys.intern("x-api-key")
+_H_ORIGIN = sys.intern("origin")
+_H_CONTENT_TYPE = sys.intern("content-type")
+_H_CLIENT_IP = sys.intern("cf-connecting-ip")
+_H_REQUEST_ID = sys.intern("x-request-id")
+
+# Methods whose bodies RequestValidationMiddleware decodes
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Shared rejection responses; never mutate these
+_ORIGIN_NOT_ALLOWED = Response(status=403, body={"error": "Origin not allowed"})
+_AUTH_REQUIRED = Response(status=401, body={"error": "Authentication required"})
+_INVALID_CREDENTIALS = Response(status=401, body={"error": "Invalid credentials"})
+
+# Prefer orjson for body decoding when installed; its JSONDecodeError
+# subclasses ValueError like the stdlib error, so handling is unchanged.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class CORSMiddleware:
     """Handle CORS for browser requests"""
@@ -33,29 +61,38 @@ class CORSMiddleware:
             "X-Request-ID",
         ]
         self.max_age = max_age
+
+        # Origin checks run on every request; hash lookup instead of list scan
+        self._allow_any_origin = "*" in self.allowed_origins
+        self._origins = frozenset(self.allowed_origins)
+
+        # Preflight headers are fixed per instance; only the origin varies
+        self._preflight_headers = {
+            "Access-Control-Allow-Methods": ", ".join(self.allowed_methods),
+            "Access-Control-Allow-Headers": ", ".join(self.allowed_headers),
+            "Access-Control-Max-Age": str(self.max_age),
+        }
+        self._wildcard_preflight = Response(
+            status=204,
+            headers={"Access-Control-Allow-Origin": "*", **self._preflight_headers},
+        )
     
     async def __call__(self, request: Request) -> Optional[Response]:
         """Process CORS headers"""
-        origin = request.headers.get("Origin", "*")
+        origin = request.headers.get(_H_ORIGIN, "*")
         
         # Check if origin is allowed
-        if self.allowed_origins != ["*"]:
-            if origin not in self.allowed_origins:
-                return Response(
-                    status=403,
-                    body={"error": "Origin not allowed"},
-                )
+        if not self._allow_any_origin:
+            if origin not in self._origins:
+                return _ORIGIN_NOT_ALLOWED
         
         # Handle preflight
-        if request.method == HttpMethod.OPTIONS:
+        if request.method == "OPTIONS":
+            if origin == "*":
+                return self._wildcard_preflight
             return Response(
                 status=204,
-                headers={
-                    "Access-Control-Allow-Origin": origin,
-                    "Access-Control-Allow-Methods": ", ".join(self.allowed_methods),
-                    "Access-Control-Allow-Headers": ", ".join(self.allowed_headers),
-                    "Access-Control-Max-Age": str(self.max_age),
-                },
+                headers={"Access-Control-Allow-Origin": origin, **self._preflight_headers},
             )
         
         # Continue processing - CORS headers added to response elsewhere
@@ -70,17 +107,17 @@ class AuthMiddleware:
             "/api/health",
             "/api/auth/login",
         ]
+        self._public_prefixes = tuple(self.public_paths)
     
     async def __call__(self, request: Request) -> Optional[Response]:
         """Authenticate request"""
         # Skip auth for public paths
-        for path in self.public_paths:
-            if request.path.startswith(path):
-                return None
+        if request.path.startswith(self._public_prefixes):
+            return None
         
         # Extract token
-        auth_header = request.headers.get("Authorization", "")
-        api_key_header = request.headers.get("X-API-Key", "")
+        auth_header = request.headers.get(_H_AUTHORIZATION, "")
+        api_key_header = request.headers.get(_H_API_KEY, "")
         
         token = None
         api_key = None
@@ -93,10 +130,7 @@ class AuthMiddleware:
         
         # Require some form of auth
         if not token and not api_key:
-            return Response(
-                status=401,
-                body={"error": "Authentication required"},
-            )
+            return _AUTH_REQUIRED
         
         # Authenticate
         from ..security.auth import get_auth_gateway
@@ -108,10 +142,7 @@ class AuthMiddleware:
             context = await gateway.authenticate(api_key)
         
         if not context.is_authenticated:
-            return Response(
-                status=401,
-                body={"error": "Invalid credentials"},
-            )
+            return _INVALID_CREDENTIALS
         
         # Attach context to request
         request.auth_context = context
@@ -120,46 +151,81 @@ class AuthMiddleware:
 
 
 class RateLimitMiddleware:
-    """Handle rate limiting"""
-    
-    def __init__(self, requests_per_minute: int = 60):
+    """
+    Handle rate limiting.
+
+    Token bucket per identifier: each bucket holds up to
+    `requests_per_minute` tokens and refills continuously at
+    `requests_per_minute / 60` tokens per second.
+
+    Buckets idle for a full window are indistinguishable from fresh ones, so
+    they are swept periodically; the table is also capped at `max_tracked`
+    identifiers, evicting the least recently seen first.
+    """
+
+    WINDOW_SECONDS = 60
+    SWEEP_INTERVAL = 30
+    MAX_TRACKED = 10000
+
+    def __init__(self, requests_per_minute: int = 60, max_tracked: int = MAX_TRACKED):
         self.requests_per_minute = requests_per_minute
-        self._request_counts: Dict[str, List[float]] = {}
-    
+        self.max_tracked = max_tracked
+        self._refill_rate = requests_per_minute / 60.0
+        # identifier -> (tokens, last_refill on the monotonic clock),
+        # least recently seen first
+        self._request_counts: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._last_sweep = _now()
+
+    def _sweep(self, now: float):
+        """Drop buckets that have been idle for a full window"""
+        cutoff = now - self.WINDOW_SECONDS
+        counts = self._request_counts
+        # Oldest entries sit at the front, so stop at the first live one
+        while counts:
+            identifier, (_, last_refill) = next(iter(counts.items()))
+            if last_refill >= cutoff:
+                break
+            del counts[identifier]
+        self._last_sweep = now
+
     async def __call__(self, request: Request) -> Optional[Response]:
         """Check rate limits"""
         # Get identifier
         if request.auth_context:
             identifier = request.auth_context.key_id
         else:
-            identifier = request.headers.get("CF-Connecting-IP", "unknown")
-        
-        now = time.time()
-        minute_ago = now - 60
-        
-        # Clean old entries
-        if identifier in self._request_counts:
-            self._request_counts[identifier] = [
-                t for t in self._request_counts[identifier]
-                if t > minute_ago
-            ]
-        else:
-            self._request_counts[identifier] = []
-        
+            identifier = request.headers.get(_H_CLIENT_IP, "unknown")
+
+        now = _now()
+        capacity = self.requests_per_minute
+        counts = self._request_counts
+
+        if now - self._last_sweep > self.SWEEP_INTERVAL:
+            self._sweep(now)
+
+        # Refill bucket; popping and re-inserting moves it to the
+        # most-recent end with two dict operations in total
+        tokens, last_refill = counts.pop(identifier, None) or (capacity, now)
+        tokens = min(capacity, tokens + (now - last_refill) * self._refill_rate)
+
         # Check limit
-        if len(self._request_counts[identifier]) >= self.requests_per_minute:
+        if tokens < 1:
+            counts[identifier] = (tokens, now)
+            retry_after = math.ceil((1 - tokens) / self._refill_rate) if self._refill_rate else 60
             return Response(
                 status=429,
                 body={"error": "Rate limit exceeded"},
                 headers={
                     "Content-Type": "application/json",
-                    "Retry-After": "60",
+                    "Retry-After": str(retry_after),
                 },
             )
-        
+
         # Record request
-        self._request_counts[identifier].append(now)
-        
+        counts[identifier] = (tokens - 1, now)
+        if len(counts) > self.max_tracked:
+            counts.popitem(last=False)
+
         return None
 
 
@@ -168,15 +234,21 @@ class RequestValidationMiddleware:
     
     async def __call__(self, request: Request) -> Optional[Response]:
         """Validate request"""
+        method = request.method
+        
+        # Bodyless methods dominate traffic; skip them before anything else
+        if method == "GET" or method == "OPTIONS":
+            return None
+        
         # Ensure body is parsed for POST/PUT/PATCH
-        if request.method in (HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH):
-            content_type = request.headers.get("Content-Type", "")
+        if method in _BODY_METHODS:
+            content_type = request.headers.get(_H_CONTENT_TYPE, "")
             
-            if "application/json" in content_type:
-                if request.body and isinstance(request.body, str):
+            if content_type.startswith("application/json"):
+                if request.body and isinstance(request.body, (str, bytes)):
                     try:
-                        request.body = json.loads(request.body)
-                    except json.JSONDecodeError:
+                        request.body = _json_loads(request.body)
+                    except ValueError:
                         return Response(
                             status=400,
                             body={"error": "Invalid JSON body"},
@@ -190,9 +262,14 @@ class LoggingMiddleware:
     
     async def __call__(self, request: Request) -> Optional[Response]:
         """Log request"""
+        if not logger.isEnabledFor(logging.INFO):
+            return None
+        
         logger.info(
-            f"{request.method.value} {request.path} "
-            f"user={getattr(request.auth_context, 'owner_id', 'anonymous')}"
+            "%s %s user=%s",
+            request.method,
+            request.path,
+            getattr(request.auth_context, "owner_id", "anonymous"),
         )
         return None
 
@@ -202,12 +279,8 @@ class RequestIDMiddleware:
     
     async def __call__(self, request: Request) -> Optional[Response]:
         """Add request ID"""
-        request_id = request.headers.get("X-Request-ID")
-        if not request_id:
-            import uuid
-            request_id = str(uuid.uuid4())
-        
-        request.headers["X-Request-ID"] = request_id
+        request_id = request.headers.get(_H_REQUEST_ID) or uuid4().hex
+        request.headers[_H_REQUEST_ID] = request_id
         return None
 
 
@@ -4,27 +4,56 @@ API Routes - HTTP endpoints for Binetic Control Center
 Designed for Cloudflare Workers deployment.
 """
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import wraps
+from types import MappingProxyType
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Pattern, Tuple
 from enum import Enum
 import json
+import re
 import time
 import logging
 
-from security.auth import AuthGateway, AuthContext, require_auth
-from security.keys import KeyManager, KeyScope, APIKey
-from security.policies import PolicyEngine, Policy, Permission, PermissionLevel, ResourceType
-from security.sessions import SessionManager, Session
-from core.brain import Brain, Thought, ThoughtType, Goal
-from core.operators import OperatorRegistry
-from core.network import EmergentNetwork
-from core.memtools import MemtoolRegistry
-from core.discovery import DiscoveryEngine
+from security.auth import AuthGateway, AuthContext, require_auth, get_auth_gateway
+from security.keys import KeyManager, KeyScope, APIKey, get_key_manager
+from security.policies import (
+    PolicyEngine,
+    Policy,
+    Permission,
+    PermissionLevel,
+    ResourceType,
+    get_policy_engine,
+)
+from security.sessions import SessionManager, Session, get_session_manager
+from security.kernel import get_kernel_enforcer
+from security.audit import AuditEntry, get_audit_log as _get_audit_log
+from core.brain import Brain, Thought, ThoughtType, Goal, get_brain
+from core.operators import OperatorRegistry, get_operator_registry, json_default as _json_default
+from core.network import EmergentNetwork, Signal, SignalType, get_network, new_signal_id
+from core.memtools import MemtoolRegistry, get_memtools
+from core.discovery import DiscoveryEngine, get_discovery_engine
+from core.query_cache import QueryCache, SemanticQueryCache
+
+# Optional JSON speedups: msgspec encodes response-row Structs straight from
+# their fields; orjson encodes the dataclass fallback rows natively.
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
-class HttpMethod(Enum):
+class HttpMethod(str, Enum):
+    """HTTP method names; members compare equal to the plain method strings"""
     GET = "GET"
     POST = "POST"
     PUT = "PUT"
@@ -36,12 +65,34 @@ class HttpMethod(Enum):
 @dataclass
 class Request:
     """HTTP request abstraction"""
-    method: HttpMethod
+    method: str  # upper-case method name, e.g. "GET"
     path: str
     headers: Dict[str, str]
     query: Dict[str, str]
     body: Optional[Any] = None
     auth_context: Optional[AuthContext] = None
+    path_params: Dict[str, str] = field(default_factory=dict)
+    _parsed: Optional[Dict[type, Any]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # Header names are case-insensitive; fold them once here so lookups
+        # downstream are plain dict hits on lower-case keys
+        self.headers = {k.lower(): v for k, v in self.headers.items()}
+
+    def parse_as(self, model: type) -> Any:
+        """Parse the JSON body into `model` via its from_body(), once per model"""
+        if self._parsed is None:
+            self._parsed = {}
+        parsed = self._parsed.get(model)
+        if parsed is None:
+            parsed = self._parsed[model] = model.from_body(self.body or {})
+        return parsed
+
+
+# Shared, read-only default for responses that don't set their own headers.
+# Code that needs to add headers must build a new dict, e.g.
+# `resp.headers = {**resp.headers, "X-Request-ID": rid}`.
+_DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
 
 
 @dataclass
@@ -49,52 +100,176 @@ class Response:
     """HTTP response abstraction"""
     status: int = 200
     body: Any = None
-    headers: Dict[str, str] = None
+    headers: Mapping[str, str] = None
     
     def __post_init__(self):
         if self.headers is None:
-            self.headers = {"Content-Type": "application/json"}
+            self.headers = _DEFAULT_HEADERS
     
     def to_dict(self) -> Dict:
         return {
             "status": self.status,
             "body": self.body,
-            "headers": self.headers,
+            "headers": dict(self.headers),
         }
 
 
+# Bodies may hold dataclasses (e.g. Memory) and row objects directly; each
+# encoder below serializes them without an intermediate to_dict() pass
+if MSGSPEC_AVAILABLE:
+    class _Row(msgspec.Struct):
+        """Base for list-response rows"""
+
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=_json_default)
+    encode_json: Callable[[Any], bytes] = _msgspec_encoder.encode
+else:
+    class _Row:
+        """Base for list-response rows (dataclass fallback)"""
+
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            dataclass(cls)
+
+    if ORJSON_AVAILABLE:
+        def encode_json(obj: Any) -> bytes:
+            """Encode a response body, including any row objects, as JSON"""
+            return orjson.dumps(
+                obj,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS,
+            )
+    else:
+        def encode_json(obj: Any) -> bytes:
+            """Encode a response body, including any row objects, as JSON"""
+            return json.dumps(obj, default=_json_default).encode()
+
+
+class KeyRow(_Row):
+    """One entry of the list_keys response"""
+    key_id: str
+    scope: str
+    owner_id: str
+    created_at: float
+    expires_at: Optional[float]
+    status: str
+
+
+class SlotRow(_Row):
+    """One entry of the list_slots response"""
+    slot_id: str
+    state: str
+    operators: List[str]
+    connections: AbstractSet[str]
+
+
+class CapabilityRow(_Row):
+    """One entry of the list_capabilities response; mirrors Capability.to_dict()"""
+    capability_id: str
+    name: str
+    capability_type: str
+    endpoint: str
+    method: str
+    input_schema: Dict[str, Any]
+    output_schema: Dict[str, Any]
+    description: str
+    version: str
+    tags: AbstractSet[str]
+    discovered_at: float
+    discovery_method: str
+    source: str
+    is_healthy: bool
+    success_rate: float
+
+
+class PolicyRow(_Row):
+    """One entry of the list_policies response"""
+    policy_id: str
+    name: str
+    description: str
+    permissions_count: int
+    is_default: bool
+
+
+# Shared responses for the common auth failures; never mutate these.
+# Bodies stay plain dicts so every adapter can JSON-encode them.
+_NOT_AUTHENTICATED = Response(status=401, body={"error": "Not authenticated"})
+_FORBIDDEN = Response(status=403, body={"error": "Insufficient permissions"})
+
+_NOT_FOUND = object()
+_PARAM_RE = re.compile(r":(\w+)")
+
+
 class Router:
     """Simple route matching for Cloudflare Workers"""
-    
+
+    MATCH_CACHE_SIZE = 4096
+
     def __init__(self):
         self._routes: Dict[str, Dict[str, Callable]] = {}
+        # Parametric routes compiled at registration, bucketed by segment
+        # count: depth -> [(regex, method -> handler)]
+        self._param_routes: Dict[int, List[Tuple[Pattern[str], Dict[str, Callable]]]] = {}
         self._middleware: List[Callable] = []
-    
+        # Middleware composed into one chain; rebuilt only by use()
+        self._pipeline: Optional[Callable] = None
+        # (path, method) -> (handler, path params) or _NOT_FOUND, least recently used first
+        self._match_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+
     def route(self, path: str, method: HttpMethod = HttpMethod.GET):
         """Decorator to register a route"""
         def decorator(handler: Callable):
             if path not in self._routes:
                 self._routes[path] = {}
+                if ":" in path:
+                    self._param_routes.setdefault(path.count("/"), []).append(
+                        (self._compile_path(path), self._routes[path])
+                    )
             self._routes[path][method.value] = handler
+            self._match_cache.clear()
             return handler
         return decorator
-    
+
+    @staticmethod
+    def _compile_path(path: str) -> Pattern[str]:
+        """Compile a :param style route into an anchored regex"""
+        pattern = _PARAM_RE.sub(r"(?P<\1>[^/]+)", re.escape(path))
+        return re.compile(f"^{pattern}$")
+
     def use(self, middleware: Callable):
         """Add middleware"""
         self._middleware.append(middleware)
-    
+        self._pipeline = self._compile_pipeline(self._middleware)
+
+    @staticmethod
+    def _compile_pipeline(middleware: List[Callable]) -> Optional[Callable]:
+        """
+        Fold middleware into a single short-circuiting chain of closures.
+
+        Each link awaits its middleware and either returns the Response it
+        produced or hands the request to the next link, so the per-request
+        path does no list iteration. The chain is as deep as the middleware
+        list; register middleware once at startup, not per request.
+        """
+        pipeline: Optional[Callable] = None
+        for mw in reversed(middleware):
+            pipeline = _link_middleware(mw, pipeline)
+        return pipeline
+
     async def handle(self, request: Request) -> Response:
         """Handle incoming request"""
         # Apply middleware
-        for mw in self._middleware:
-            result = await mw(request)
-            if isinstance(result, Response):
+        pipeline = self._pipeline
+        if pipeline is not None:
+            result = await pipeline(request)
+            if result is not None:
                 return result
-        
+
         # Find matching route
-        handler = self._find_handler(request.path, request.method.value)
+        handler, params = self._find_handler(request.path, request.method)
         if not handler:
             return Response(status=404, body={"error": "Not found"})
+        if params:
+            request.path_params = dict(params)
         
         try:
             return await handler(request)
@@ -102,34 +277,160 @@ class Router:
             logger.error(f"Route error: {e}")
             return Response(status=500, body={"error": str(e)})
     
-    def _find_handler(self, path: str, method: str) -> Optional[Callable]:
-        """Find handler for path and method"""
+    def _find_handler(
+        self, path: str, method: str
+    ) -> Tuple[Optional[Callable], Dict[str, str]]:
+        """Find handler and path params for path and method, memoizing the lookup"""
+        cache = self._match_cache
+        key = (path, method)
+
+        match = cache.get(key)
+        if match is not None:
+            cache.move_to_end(key)
+            return (None, {}) if match is _NOT_FOUND else match
+
+        match = self._match_route(path, method)
+
+        cache[key] = _NOT_FOUND if match[0] is None else match
+        if len(cache) > self.MATCH_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return match
+
+    def _match_route(
+        self, path: str, method: str
+    ) -> Tuple[Optional[Callable], Dict[str, str]]:
+        """Resolve handler and path params against registered routes"""
         # Exact match
         if path in self._routes and method in self._routes[path]:
-            return self._routes[path][method]
-        
-        # Pattern matching (simple :param style)
-        for route_path, methods in self._routes.items():
-            if self._path_matches(route_path, path) and method in methods:
-                return methods[method]
-        
-        return None
-    
-    def _path_matches(self, pattern: str, path: str) -> bool:
-        """Check if path matches pattern with :params"""
-        pattern_parts = pattern.split("/")
-        path_parts = path.split("/")
-        
-        if len(pattern_parts) != len(path_parts):
-            return False
+            return self._routes[path][method], {}
         
-        for pp, cp in zip(pattern_parts, path_parts):
-            if pp.startswith(":"):
-                continue
-            if pp != cp:
-                return False
+        # Pattern matching (simple :param style); params never contain "/",
+        # so only routes with the same number of segments can match
+        for compiled, methods in self._param_routes.get(path.count("/"), ()):
+            if method in methods:
+                m = compiled.match(path)
+                if m:
+                    return methods[method], m.groupdict()
         
-        return True
+        return None, {}
+
+
+def _link_middleware(mw: Callable, next_link: Optional[Callable]) -> Callable:
+    """Wrap a middleware so it falls through to the next link in the chain"""
+    if next_link is None:
+        async def tail(request: Request) -> Optional[Response]:
+            result = await mw(request)
+            return result if isinstance(result, Response) else None
+        return tail
+
+    async def link(request: Request) -> Optional[Response]:
+        result = await mw(request)
+        if isinstance(result, Response):
+            return result
+        return await next_link(request)
+    return link
+
+
+def require_authenticated(handler: Callable):
+    """Decorator returning 401 for requests without an auth context"""
+    @wraps(handler)
+    async def wrapper(request: Request) -> Response:
+        if not request.auth_context:
+            return _NOT_AUTHENTICATED
+        return await handler(request)
+    return wrapper
+
+
+def require_permission(
+    resource_type: ResourceType,
+    level: PermissionLevel,
+    resource_id: str = "*",
+    path_param: Optional[str] = None,
+):
+    """
+    Decorator to require an authenticated caller with a permission level.
+
+    The resource id is either fixed at decoration time or read from the
+    matched route's `path_param`. Returns 401/403 responses instead of
+    calling the handler when the check fails. Every decision is recorded in
+    the audit log.
+    """
+    def decorator(handler: Callable):
+        gateway: Optional[AuthGateway] = None
+        audit_log = None
+
+        @wraps(handler)
+        async def wrapper(request: Request) -> Response:
+            nonlocal gateway, audit_log
+            context = request.auth_context
+            if not context:
+                return _NOT_AUTHENTICATED
+
+            if gateway is None:
+                gateway = get_auth_gateway()
+                audit_log = _get_audit_log()
+
+            target = request.path_params[path_param] if path_param else resource_id
+            allowed, _ = await gateway.check_access(context, resource_type, target, level)
+            audit_log.record(AuditEntry(
+                resource_type=resource_type.value,
+                resource_id=target,
+                level=level.name,
+                allowed=allowed,
+                owner_id=context.owner_id,
+                key_id=context.key.key_id if context.key else None,
+                policy_id=context.policy_id,
+                method=request.method,
+                path=request.path,
+            ))
+            if not allowed:
+                return _FORBIDDEN
+
+            return await handler(request)
+        return wrapper
+    return decorator
+
+
+class _Services:
+    """
+    Process-wide singletons for the handlers, resolved through their get_*
+    accessors on first access and then read as plain instance attributes.
+    """
+
+    _factories: Dict[str, Callable[[], Any]] = {
+        "audit_log": _get_audit_log,
+        "auth_gateway": get_auth_gateway,
+        "discovery": get_discovery_engine,
+        "kernel_enforcer": get_kernel_enforcer,
+        "key_manager": get_key_manager,
+        "memtools": get_memtools,
+        "network": get_network,
+        "operator_registry": get_operator_registry,
+        "policy_engine": get_policy_engine,
+        "session_manager": get_session_manager,
+    }
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            factory = self._factories[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = factory()
+        setattr(self, name, value)
+        return value
+
+
+_services = _Services()
+
+
+# Read-through caches for repeated queries; writes through the API invalidate
+# them, and TTLs bound staleness for writes made elsewhere
+_recall_cache = QueryCache(max_size=2000, ttl_seconds=300.0)
+_semantic_recall_cache = SemanticQueryCache()
+_capabilities_cache = QueryCache(max_size=1, ttl_seconds=300.0)
+_slots_cache = QueryCache(max_size=1, ttl_seconds=1.0)
+_detailed_health_cache = QueryCache(max_size=1, ttl_seconds=0.5)
 
 
 # Create main router
@@ -149,16 +450,14 @@ async def login(request: Request) -> Response:
     if not api_key:
         return Response(status=400, body={"error": "API key required"})
     
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
+    gateway = _services.auth_gateway
     
     context = await gateway.authenticate(api_key)
     if not context.is_authenticated:
         return Response(status=401, body={"error": "Invalid API key"})
     
     # Create session
-    from security.sessions import get_session_manager
-    sessions = get_session_manager()
+    sessions = _services.session_manager
     session = await sessions.create_session(
         key_id=context.key_id,
         owner_id=context.owner_id,
@@ -179,13 +478,12 @@ async def login(request: Request) -> Response:
 async def logout(request: Request) -> Response:
     """End session and invalidate token"""
     if not request.auth_context or not request.auth_context.is_authenticated:
-        return Response(status=401, body={"error": "Not authenticated"})
+        return _NOT_AUTHENTICATED
     
     # Delete session
     session_id = request.body.get("session_id") if request.body else None
     if session_id:
-        from security.sessions import get_session_manager
-        sessions = get_session_manager()
+        sessions = _services.session_manager
         await sessions.delete_session(session_id)
     
     return Response(body={"status": "logged_out"})
@@ -195,10 +493,9 @@ async def logout(request: Request) -> Response:
 async def refresh_token(request: Request) -> Response:
     """Refresh authentication token"""
     if not request.auth_context or not request.auth_context.is_authenticated:
-        return Response(status=401, body={"error": "Not authenticated"})
+        return _NOT_AUTHENTICATED
     
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
+    gateway = _services.auth_gateway
     
     token = gateway.create_token(request.auth_context)
     
@@ -213,25 +510,10 @@ async def refresh_token(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/keys", HttpMethod.GET)
+@require_permission(ResourceType.KEY, PermissionLevel.READ)
 async def list_keys(request: Request) -> Response:
     """List API keys (admin only)"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    # Check admin permission
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.KEY,
-        "*",
-        PermissionLevel.READ,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
-    from security.keys import get_key_manager
-    keys = get_key_manager()
+    keys = _services.key_manager
     
     key_list = await keys.list_keys(
         owner_id=request.auth_context.owner_id,
@@ -240,44 +522,23 @@ async def list_keys(request: Request) -> Response:
     
     return Response(body={
         "keys": [
-            {
-                "key_id": k.key_id,
-                "scope": k.scope.value,
-                "owner_id": k.owner_id,
-                "created_at": k.created_at,
-                "expires_at": k.expires_at,
-                "status": k.status.value,
-            }
+            KeyRow(k.key_id, k.scope.value, k.owner_id, k.created_at, k.expires_at, k.status.value)
             for k in key_list
         ]
     })
 
 
 @router.route("/api/keys", HttpMethod.POST)
+@require_permission(ResourceType.KEY, PermissionLevel.WRITE)
 async def create_key(request: Request) -> Response:
     """Create a new API key"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.KEY,
-        "*",
-        PermissionLevel.WRITE,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
     body = request.body or {}
     scope = KeyScope(body.get("scope", "user"))
     policy_id = body.get("policy_id")
     expires_days = body.get("expires_days", 365)
     metadata = body.get("metadata", {})
     
-    from security.keys import get_key_manager
-    keys = get_key_manager()
+    keys = _services.key_manager
     
     key, raw_key = await keys.create_key(
         scope=scope,
@@ -298,26 +559,12 @@ async def create_key(request: Request) -> Response:
 
 
 @router.route("/api/keys/:key_id", HttpMethod.DELETE)
+@require_permission(ResourceType.KEY, PermissionLevel.WRITE, path_param="key_id")
 async def revoke_key(request: Request) -> Response:
     """Revoke an API key"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
+    key_id = request.path_params["key_id"]
     
-    key_id = request.path.split("/")[-1]
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.KEY,
-        key_id,
-        PermissionLevel.WRITE,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
-    from security.keys import get_key_manager
-    keys = get_key_manager()
+    keys = _services.key_manager
     
     success = await keys.revoke_key(key_id)
     if not success:
@@ -331,58 +578,25 @@ async def revoke_key(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/policies", HttpMethod.GET)
+@require_permission(ResourceType.POLICY, PermissionLevel.READ)
 async def list_policies(request: Request) -> Response:
     """List policies"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.POLICY,
-        "*",
-        PermissionLevel.READ,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
-    from security.policies import get_policy_engine
-    policies = get_policy_engine()
+    policies = _services.policy_engine
     
     policy_list = list(policies._policies.values())
     
     return Response(body={
         "policies": [
-            {
-                "policy_id": p.policy_id,
-                "name": p.name,
-                "description": p.description,
-                "permissions_count": len(p.permissions),
-                "is_default": p.is_default,
-            }
+            PolicyRow(p.policy_id, p.name, p.description, len(p.permissions), p.is_default)
             for p in policy_list
         ]
     })
 
 
 @router.route("/api/policies", HttpMethod.POST)
+@require_permission(ResourceType.POLICY, PermissionLevel.ADMIN)
 async def create_policy(request: Request) -> Response:
     """Create a new policy (master only)"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.POLICY,
-        "*",
-        PermissionLevel.ADMIN,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
     body = request.body or {}
     
     policy = Policy(
@@ -400,8 +614,7 @@ async def create_policy(request: Request) -> Response:
         )
         policy.permissions.append(perm)
     
-    from security.policies import get_policy_engine
-    policies = get_policy_engine()
+    policies = _services.policy_engine
     policies.register_policy(policy)
     
     return Response(status=201, body={
@@ -415,25 +628,10 @@ async def create_policy(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/kernel/policies", HttpMethod.GET)
+@require_permission(ResourceType.SYSTEM, PermissionLevel.MASTER, resource_id="kernel")
 async def list_kernel_policies(request: Request) -> Response:
     """List kernel policies (master only)"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-
-    allowed, _ = await gateway.check_access(
-        request.auth_context,
-        ResourceType.SYSTEM,
-        resource_id="kernel",
-        required_level=PermissionLevel.MASTER,
-    )
-    if not allowed:
-        return Response(status=403, body={"error": "Insufficient permissions"})
-
-    from security.kernel import get_kernel_enforcer
-    enforcer = get_kernel_enforcer()
+    enforcer = _services.kernel_enforcer
 
     return Response(
         body={
@@ -443,26 +641,11 @@ async def list_kernel_policies(request: Request) -> Response:
 
 
 @router.route("/api/kernel/policies/:policy_id", HttpMethod.GET)
+@require_permission(ResourceType.SYSTEM, PermissionLevel.MASTER, resource_id="kernel")
 async def get_kernel_policy(request: Request) -> Response:
     """Get a kernel policy by id (master only)"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-
-    allowed, _ = await gateway.check_access(
-        request.auth_context,
-        ResourceType.SYSTEM,
-        resource_id="kernel",
-        required_level=PermissionLevel.MASTER,
-    )
-    if not allowed:
-        return Response(status=403, body={"error": "Insufficient permissions"})
-
-    policy_id = request.path.split("/")[-1]
-    from security.policies import get_policy_engine
-    pe = get_policy_engine()
+    policy_id = request.path_params["policy_id"]
+    pe = _services.policy_engine
     policy = await pe.get_policy(policy_id)
     if not policy or not policy.policy_id.startswith("kpol_"):
         return Response(status=404, body={"error": "Kernel policy not found"})
@@ -470,24 +653,29 @@ async def get_kernel_policy(request: Request) -> Response:
     return Response(body=policy.to_dict())
 
 
-@router.route("/api/kernel/policies", HttpMethod.POST)
-async def create_kernel_policy(request: Request) -> Response:
-    """Create a kernel policy (master only)"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
+# Value -> member maps so permission parsing skips EnumMeta.__call__
+_RESOURCE_TYPES: Dict[str, ResourceType] = {m.value: m for m in ResourceType}
+_PERMISSION_LEVELS: Dict[int, PermissionLevel] = {m.value: m for m in PermissionLevel}
 
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
 
-    allowed, _ = await gateway.check_access(
-        request.auth_context,
-        ResourceType.SYSTEM,
-        resource_id="kernel",
-        required_level=PermissionLevel.MASTER,
-    )
-    if not allowed:
-        return Response(status=403, body={"error": "Insufficient permissions"})
+def _parse_kernel_permissions(items: List[Dict]) -> List[Permission]:
+    """Build Permission objects from request JSON; raises on the first bad entry"""
+    resource_types = _RESOURCE_TYPES
+    levels = _PERMISSION_LEVELS
+    return [
+        Permission(
+            resource_type=resource_types[p["resource_type"]],
+            resource_id=p.get("resource_id"),
+            level=levels[int(p["level"])],
+        )
+        for p in items
+    ]
+
 
+@router.route("/api/kernel/policies", HttpMethod.POST)
+@require_permission(ResourceType.SYSTEM, PermissionLevel.MASTER, resource_id="kernel")
+async def create_kernel_policy(request: Request) -> Response:
+    """Create a kernel policy (master only)"""
     body = request.body or {}
 
     # Create a kernel policy with explicit ID prefix
@@ -503,19 +691,10 @@ async def create_kernel_policy(request: Request) -> Response:
     )
 
     # Parse permissions
-    perms = []
-    for perm_data in body.get("permissions", []):
-        try:
-            perms.append(
-                Permission(
-                    resource_type=ResourceType(perm_data["resource_type"]),
-                    resource_id=perm_data.get("resource_id"),
-                    level=PermissionLevel(int(perm_data["level"])),
-                )
-            )
-        except Exception as e:
-            return Response(status=400, body={"error": f"Invalid permission: {e}"})
-    policy.permissions = perms
+    try:
+        policy.permissions = _parse_kernel_permissions(body.get("permissions", []))
+    except Exception as e:
+        return Response(status=400, body={"error": f"Invalid permission: {e}"})
 
     # Allow/deny lists
     policy.allowed_operators = body.get("allowed_operators", [])
@@ -527,37 +706,22 @@ async def create_kernel_policy(request: Request) -> Response:
     if "is_active" in body:
         policy.is_active = bool(body.get("is_active"))
 
-    from security.policies import get_policy_engine
-    pe = get_policy_engine()
+    pe = _services.policy_engine
     pe._policies[policy.policy_id] = policy
+    pe.mark_changed()
 
     return Response(status=201, body=policy.to_dict())
 
 
 @router.route("/api/kernel/policies/:policy_id", HttpMethod.PATCH)
+@require_permission(ResourceType.SYSTEM, PermissionLevel.MASTER, resource_id="kernel")
 async def update_kernel_policy(request: Request) -> Response:
     """Update a kernel policy (master only)."""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-
-    allowed, _ = await gateway.check_access(
-        request.auth_context,
-        ResourceType.SYSTEM,
-        resource_id="kernel",
-        required_level=PermissionLevel.MASTER,
-    )
-    if not allowed:
-        return Response(status=403, body={"error": "Insufficient permissions"})
-
-    policy_id = request.path.split("/")[-1]
+    policy_id = request.path_params["policy_id"]
     if not policy_id.startswith("kpol_"):
         return Response(status=404, body={"error": "Kernel policy not found"})
 
-    from security.policies import get_policy_engine
-    pe = get_policy_engine()
+    pe = _services.policy_engine
     policy = await pe.get_policy(policy_id)
     if not policy:
         return Response(status=404, body={"error": "Kernel policy not found"})
@@ -574,21 +738,13 @@ async def update_kernel_policy(request: Request) -> Response:
     ]:
         if key in body:
             setattr(policy, key, body[key])
+    pe.mark_changed()
 
     if "permissions" in body:
-        perms = []
-        for perm_data in body.get("permissions", []):
-            try:
-                perms.append(
-                    Permission(
-                        resource_type=ResourceType(perm_data["resource_type"]),
-                        resource_id=perm_data.get("resource_id"),
-                        level=PermissionLevel(int(perm_data["level"])),
-                    )
-                )
-            except Exception as e:
-                return Response(status=400, body={"error": f"Invalid permission: {e}"})
-        policy.permissions = perms
+        try:
+            policy.permissions = _parse_kernel_permissions(body["permissions"])
+        except Exception as e:
+            return Response(status=400, body={"error": f"Invalid permission: {e}"})
 
     policy.updated_at = time.time()
     pe._policies[policy.policy_id] = policy
@@ -597,29 +753,14 @@ async def update_kernel_policy(request: Request) -> Response:
 
 
 @router.route("/api/kernel/policies/:policy_id", HttpMethod.DELETE)
+@require_permission(ResourceType.SYSTEM, PermissionLevel.MASTER, resource_id="kernel")
 async def delete_kernel_policy(request: Request) -> Response:
     """Delete a kernel policy (master only)."""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-
-    allowed, _ = await gateway.check_access(
-        request.auth_context,
-        ResourceType.SYSTEM,
-        resource_id="kernel",
-        required_level=PermissionLevel.MASTER,
-    )
-    if not allowed:
-        return Response(status=403, body={"error": "Insufficient permissions"})
-
-    policy_id = request.path.split("/")[-1]
+    policy_id = request.path_params["policy_id"]
     if not policy_id.startswith("kpol_"):
         return Response(status=404, body={"error": "Kernel policy not found"})
 
-    from security.policies import get_policy_engine
-    pe = get_policy_engine()
+    pe = _services.policy_engine
     ok = await pe.delete_policy(policy_id)
     if not ok:
         return Response(status=404, body={"error": "Kernel policy not found"})
@@ -632,22 +773,9 @@ async def delete_kernel_policy(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/brain/think", HttpMethod.POST)
+@require_permission(ResourceType.SYSTEM, PermissionLevel.EXECUTE, resource_id="brain")
 async def think(request: Request) -> Response:
     """Submit a thought for processing"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.SYSTEM,
-        "brain",
-        PermissionLevel.EXECUTE,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
     body = request.body or {}
     
     thought = Thought(
@@ -658,10 +786,11 @@ async def think(request: Request) -> Response:
         source=request.auth_context.key_id,
     )
     
-    from core.brain import get_brain
     brain = await get_brain()
     
-    result = await brain.think(thought)
+    # Through the bounded worker queue, so bursts of requests are batched
+    # and excess load waits instead of piling up concurrent thoughts
+    result = await brain.submit(thought)
     
     return Response(body={
         "thought_id": thought.thought_id,
@@ -671,23 +800,18 @@ async def think(request: Request) -> Response:
 
 
 @router.route("/api/brain/stats", HttpMethod.GET)
+@require_authenticated
 async def brain_stats(request: Request) -> Response:
     """Get brain statistics"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from core.brain import get_brain
     brain = await get_brain()
     
     return Response(body=brain.stats())
 
 
 @router.route("/api/brain/goals", HttpMethod.POST)
+@require_authenticated
 async def set_goal(request: Request) -> Response:
     """Set a new goal"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
     body = request.body or {}
     
     goal = Goal(
@@ -696,7 +820,6 @@ async def set_goal(request: Request) -> Response:
         priority=body.get("priority", 0.5),
     )
     
-    from core.brain import get_brain
     brain = await get_brain()
     await brain.set_goal(goal)
     
@@ -711,64 +834,77 @@ async def set_goal(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/network/slots", HttpMethod.GET)
+@require_authenticated
 async def list_slots(request: Request) -> Response:
     """List network slots"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from core.network import get_network
-    network = get_network()
-    
-    slots = list(network.slots.values())
+    body = _slots_cache.get(None)
+    if body is None:
+        # One pass over the live slots; the encoder writes each row's
+        # operator list and connection set without copying them first
+        body = {
+            "slots": [
+                SlotRow(s.slot_id, s.state.value, s.operator_ids, s.connections)
+                for s in _services.network.slots.values()
+            ]
+        }
+        _slots_cache.put(None, body)
     
-    return Response(body={
-        "slots": [
-            {
-                "slot_id": s.slot_id,
-                "state": s.state.value,
-                "operators": s.operator_ids,
-                "connections": list(s.connections),
-            }
-            for s in slots
-        ]
-    })
+    return Response(body=body)
+
+
+_SIGNAL_TYPES: Dict[str, SignalType] = {m.value: m for m in SignalType}
+
+
+def _build_signal(data: Dict) -> Signal:
+    """Build a Signal from request JSON; raises on an unknown type"""
+    return Signal(
+        signal_id=new_signal_id(),
+        signal_type=_SIGNAL_TYPES[data.get("type", "broadcast")],
+        source_slot=data.get("source", "api"),
+        target_slot=data.get("target"),
+        payload=data.get("payload") or {},
+    )
 
 
 @router.route("/api/network/signal", HttpMethod.POST)
+@require_permission(ResourceType.NETWORK, PermissionLevel.EXECUTE)
 async def emit_signal(request: Request) -> Response:
     """Emit a signal to the network"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
+    body = request.body or {}
+    
+    network = _services.network
     
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
+    try:
+        signal = _build_signal(body)
+    except KeyError as e:
+        return Response(status=400, body={"error": f"Invalid signal type: {e}"})
     
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.NETWORK,
-        "*",
-        PermissionLevel.EXECUTE,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
+    await network.send_signal(signal)
     
+    return Response(body={
+        "signal_id": signal.signal_id,
+        "emitted": True,
+    })
+
+
+@router.route("/api/network/signals/batch", HttpMethod.POST)
+@require_permission(ResourceType.NETWORK, PermissionLevel.EXECUTE)
+async def emit_signals_batch(request: Request) -> Response:
+    """Emit a batch of signals with one permission check"""
     body = request.body or {}
     
-    from core.network import Signal, get_network
-    network = get_network()
+    network = _services.network
     
-    signal = Signal(
-        signal_id=f"sig_{int(time.time() * 1000)}",
-        signal_type=body.get("type", "data"),
-        payload=body.get("payload"),
-        source=body.get("source", "api"),
-        target=body.get("target"),
-    )
+    try:
+        signals = [_build_signal(data) for data in body.get("signals", [])]
+    except KeyError as e:
+        return Response(status=400, body={"error": f"Invalid signal type: {e}"})
     
-    await network.emit(signal)
+    signal_ids = await network.send_signals(signals)
     
     return Response(body={
-        "signal_id": signal.signal_id,
-        "emitted": True,
+        "signal_ids": signal_ids,
+        "count": len(signal_ids),
     })
 
 
@@ -777,47 +913,45 @@ async def emit_signal(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/discovery/capabilities", HttpMethod.GET)
+@require_authenticated
 async def list_capabilities(request: Request) -> Response:
     """List discovered capabilities"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from core.discovery import get_discovery_engine
-    discovery = get_discovery_engine()
-    
-    capabilities = discovery.search_capabilities()
+    discovery = _services.discovery
+    # Keyed on the discovery version: any registration or health change
+    # (API, brain adaptation, health checks) misses the cache
+    key = discovery.version
+    body = _capabilities_cache.get(key)
+    if body is None:
+        capabilities = discovery.search_capabilities()
+        
+        body = {
+            "capabilities": [
+                CapabilityRow(
+                    c.capability_id, c.name, c.capability_type.value, c.endpoint,
+                    c.method, c.input_schema, c.output_schema, c.description,
+                    c.version, c.tags, c.discovered_at, c.discovery_method.value,
+                    c.source, c.is_healthy, c.success_rate,
+                )
+                for c in capabilities
+            ],
+        }
+        _capabilities_cache.put(key, body)
     
-    return Response(body={
-        "capabilities": [c.to_dict() for c in capabilities],
-    })
+    return Response(body=body)
 
 
 @router.route("/api/discovery/discover", HttpMethod.POST)
+@require_permission(ResourceType.SYSTEM, PermissionLevel.ADMIN, resource_id="discovery")
 async def trigger_discovery(request: Request) -> Response:
     """Trigger capability discovery"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.SYSTEM,
-        "discovery",
-        PermissionLevel.ADMIN,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
-    from core.discovery import get_discovery_engine
-    discovery = get_discovery_engine()
+    discovery = _services.discovery
     
     results = await discovery.discover_all()
     
     return Response(body={
         "discovery_complete": True,
         "sources_probed": len(results),
-        "total_capabilities": sum(len(caps) for caps in results.values()),
+        "total_capabilities": sum(map(len, results.values())),
     })
 
 
@@ -825,23 +959,62 @@ async def trigger_discovery(request: Request) -> Response:
 # Memory Routes
 # ============================================================================
 
+@dataclass(slots=True)
+class StoreMemoryRequest:
+    """Body of POST /api/memory/store"""
+    content: Any = None
+    memory_type: str = "general"
+    importance: float = 0.5
+    tags: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_body(cls, body: Dict) -> "StoreMemoryRequest":
+        tags = body.get("tags")
+        return cls(
+            content=body.get("content"),
+            memory_type=body.get("type", "general"),
+            importance=body.get("importance", 0.5),
+            tags=frozenset(tags) if tags else frozenset(),
+        )
+
+
+@dataclass(slots=True)
+class RecallMemoryRequest:
+    """Body of POST /api/memory/recall"""
+    memory_id: Optional[str] = None
+    query: Optional[str] = None
+    tags: Optional[FrozenSet[str]] = None
+    memory_type: Optional[str] = None
+    limit: int = 10
+
+    @classmethod
+    def from_body(cls, body: Dict) -> "RecallMemoryRequest":
+        tags = body.get("tags")
+        return cls(
+            memory_id=body.get("memory_id"),
+            query=body.get("query"),
+            tags=frozenset(tags) if tags else None,
+            memory_type=body.get("type"),
+            limit=body.get("limit", 10),
+        )
+
+
 @router.route("/api/memory/store", HttpMethod.POST)
+@require_authenticated
 async def store_memory(request: Request) -> Response:
     """Store a memory"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
+    req = request.parse_as(StoreMemoryRequest)
     
-    body = request.body or {}
-    
-    from core.memtools import get_memtools
-    memtools = get_memtools()
+    memtools = _services.memtools
     
     memory = await memtools.store(
-        content=body.get("content"),
-        memory_type=body.get("type", "general"),
-        importance=body.get("importance", 0.5),
-        tags=set(body.get("tags", [])),
+        content=req.content,
+        memory_type=req.memory_type,
+        importance=req.importance,
+        tags=req.tags,
     )
+    _recall_cache.invalidate_all()
+    _semantic_recall_cache.invalidate_all()
     
     return Response(status=201, body={
         "memory_id": memory.memory_id,
@@ -850,37 +1023,61 @@ async def store_memory(request: Request) -> Response:
 
 
 @router.route("/api/memory/recall", HttpMethod.POST)
+@require_authenticated
 async def recall_memory(request: Request) -> Response:
     """Recall memories"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
+    req = request.parse_as(RecallMemoryRequest)
     
-    body = request.body or {}
+    memtools = _services.memtools
     
-    from core.memtools import get_memtools
-    memtools = get_memtools()
+    key = (
+        memtools.generation,
+        req.memory_id,
+        req.query,
+        req.tags,
+        req.memory_type,
+        req.limit,
+    )
+    cached = _recall_cache.get(key)
+    if cached is not None:
+        return Response(body=cached)
+    
+    # Near-duplicate phrasings of a query share results: same filters
+    # (key minus the query text) and a similar query embedding
+    query_embedding = None
+    if req.query and not req.memory_id:
+        query_embedding = await memtools.embed(req.query)
+    if query_embedding:
+        scope = (memtools.generation, req.tags, req.memory_type, req.limit)
+        cached = _semantic_recall_cache.get(scope, query_embedding)
+        if cached is not None:
+            _recall_cache.put(key, cached)
+            return Response(body=cached)
     
     memories = await memtools.recall(
-        memory_id=body.get("memory_id"),
-        query=body.get("query"),
-        tags=set(body.get("tags", [])) if body.get("tags") else None,
-        memory_type=body.get("type"),
-        limit=body.get("limit", 10),
+        memory_id=req.memory_id,
+        query=req.query,
+        tags=req.tags,
+        memory_type=req.memory_type,
+        limit=req.limit,
+        query_embedding=query_embedding,
     )
     
-    return Response(body={
-        "memories": [m.to_dict() for m in memories],
-    })
+    result = {
+        "memories": memories,
+    }
+    _recall_cache.put(key, result)
+    if query_embedding:
+        _semantic_recall_cache.put(scope, query_embedding, result)
+    
+    return Response(body=result)
 
 
 @router.route("/api/memory/stats", HttpMethod.GET)
+@require_authenticated
 async def memory_stats(request: Request) -> Response:
     """Get memory statistics"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from core.memtools import get_memtools
-    memtools = get_memtools()
+    memtools = _services.memtools
     
     return Response(body=memtools.stats())
 
@@ -890,13 +1087,10 @@ async def memory_stats(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/operators", HttpMethod.GET)
+@require_authenticated
 async def list_operators(request: Request) -> Response:
     """List registered operators"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from core.operators import get_operator_registry
-    registry = get_operator_registry()
+    registry = _services.operator_registry
     
     operators = list(registry._operators.keys())
     
@@ -906,28 +1100,14 @@ async def list_operators(request: Request) -> Response:
 
 
 @router.route("/api/operators/:name/invoke", HttpMethod.POST)
+@require_permission(ResourceType.OPERATOR, PermissionLevel.EXECUTE, path_param="name")
 async def invoke_operator(request: Request) -> Response:
     """Invoke an operator"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    operator_name = request.path.split("/")[-2]
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.OPERATOR,
-        operator_name,
-        PermissionLevel.EXECUTE,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
+    operator_name = request.path_params["name"]
     
     body = request.body or {}
     
-    from core.operators import get_operator_registry
-    registry = get_operator_registry()
+    registry = _services.operator_registry
     
     result = await registry.invoke(operator_name, body.get("input"))
     
@@ -942,26 +1122,17 @@ async def invoke_operator(request: Request) -> Response:
 # ============================================================================
 
 @router.route("/api/audit", HttpMethod.GET)
+@require_permission(ResourceType.AUDIT, PermissionLevel.READ)
 async def get_audit_log(request: Request) -> Response:
     """Get audit log (admin only)"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from security.auth import get_auth_gateway
-    gateway = get_auth_gateway()
-    
-    if not await gateway.authorize(
-        request.auth_context,
-        ResourceType.AUDIT,
-        "*",
-        PermissionLevel.READ,
-    ):
-        return Response(status=403, body={"error": "Insufficient permissions"})
-    
-    # In production, this would query D1
+    try:
+        limit = int(request.query.get("limit", 100))
+    except (TypeError, ValueError):
+        return Response(status=400, body={"error": "limit must be an integer"})
+    entries = _services.audit_log.recent(limit)
     return Response(body={
-        "audit_entries": [],
-        "note": "Audit log stored in Cloudflare D1",
+        "audit_entries": [e.to_dict() for e in entries],
+        "count": len(entries),
     })
 
 
@@ -969,36 +1140,53 @@ async def get_audit_log(request: Request) -> Response:
 # Health Routes
 # ============================================================================
 
+# Probes hit /api/health far more often than once a second; share one
+# response per second and let clients cache it for that long
+_HEALTH_TTL = 1.0
+_HEALTH_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Content-Type": "application/json",
+    "Cache-Control": "max-age=1",
+})
+_health_response: Optional[Response] = None
+
+
 @router.route("/api/health", HttpMethod.GET)
 async def health_check(request: Request) -> Response:
     """Health check endpoint (no auth required)"""
-    return Response(body={
-        "status": "healthy",
-        "timestamp": time.time(),
-        "version": "1.0.0",
-    })
+    global _health_response
+    now = time.time()
+    response = _health_response
+    if response is None or now - response.body["timestamp"] >= _HEALTH_TTL:
+        response = _health_response = Response(
+            body={
+                "status": "healthy",
+                "timestamp": now,
+                "version": "1.0.0",
+            },
+            headers=_HEALTH_HEADERS,
+        )
+    return response
 
 
 @router.route("/api/health/detailed", HttpMethod.GET)
+@require_authenticated
 async def detailed_health(request: Request) -> Response:
     """Detailed health check"""
-    if not request.auth_context:
-        return Response(status=401, body={"error": "Not authenticated"})
-    
-    from core.brain import get_brain
-    from core.network import get_network
-    from core.discovery import get_discovery_engine
-    
-    brain = await get_brain()
-    network = get_network()
-    discovery = get_discovery_engine()
+    # Probes poll every few seconds; one snapshot serves them all briefly
+    body = _detailed_health_cache.get(None)
+    if body is None:
+        brain = await get_brain()
+        slot_count, running = _services.network.snapshot()
+        
+        body = {
+            "status": "healthy",
+            "components": {
+                "brain": {"state": brain.state.value},
+                "network": {"slots": slot_count, "running": running},
+                "discovery": _services.discovery.stats(),
+            },
+            "timestamp": time.time(),
+        }
+        _detailed_health_cache.put(None, body)
     
-    return Response(body={
-        "status": "healthy",
-        "components": {
-            "brain": {"state": brain.state.value},
-            "network": {"slots": len(network.slots), "running": network._running},
-            "discovery": discovery.stats(),
-        },
-        "timestamp": time.time(),
-    })
+    return Response(body=body)
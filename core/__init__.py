@@ -7,6 +7,8 @@ Contains the emergent AGI systems:
 - Memtools: Reactive memory tools
 - Discovery: Capability discovery
 - Brain: Central coordinator
+- QueryCache: LRU/TTL and similarity-aware caches for repeated queries
+- Quantization: Product quantization and IVF partitioning for embeddings
 """
 
 from .operators import (
@@ -48,6 +50,8 @@ from .brain import (
     Goal,
     get_brain,
 )
+from .query_cache import QueryCache, SemanticQueryCache
+from .quantization import CoarseQuantizer, PQCodec
 
 __all__ = [
     # Operators
@@ -84,4 +88,10 @@ __all__ = [
     "ThoughtType",
     "Goal",
     "get_brain",
+    # Query cache
+    "QueryCache",
+    "SemanticQueryCache",
+    # Quantization
+    "CoarseQuantizer",
+    "PQCodec",
 ]
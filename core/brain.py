@@ -4,21 +4,56 @@ Brain - Central Intelligence Coordinator
 The emergent intelligence core that orchestrates all subsystems.
 """
 
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Awaitable, Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 from enum import Enum
 import time
 import logging
 import asyncio
+import re
+import reprlib
 
 from .operators import OperatorRegistry, OperatorType, OperatorSignature, get_operator_registry
-from .network import EmergentNetwork, ReactiveSlot, Signal, get_network
+from .network import EmergentNetwork, ReactiveSlot, Signal, SignalType, get_network
 from .memtools import MemtoolRegistry, get_memtools
 from .discovery import DiscoveryEngine, Capability, CapabilityType, get_discovery_engine
+from .query_cache import QueryCache
 
 logger = logging.getLogger(__name__)
 
 
+# Name keywords for heuristic operator classification, highest priority first:
+# (keywords, operator type, side effects)
+_OPERATOR_KEYWORDS = (
+    (("search", "searches", "find", "finds", "query", "queries"), OperatorType.SEARCH, False),
+    (("store", "stores", "save", "saves", "write", "writes", "upload", "uploads"), OperatorType.STORE, True),
+    (("read", "reads", "get", "gets", "fetch", "fetches", "download", "downloads"), OperatorType.RETRIEVE, False),
+    (("send", "sends", "notify", "notifies", "broadcast", "broadcasts"), OperatorType.BROADCAST, True),
+    (("embed", "embeds", "embedding", "embeddings"), OperatorType.EMBED, False),
+)
+
+# keyword -> (priority, operator type, side effects)
+_KEYWORD_RULES: Dict[str, Tuple[int, OperatorType, bool]] = {
+    keyword: (priority, op_type, side_effects)
+    for priority, (keywords, op_type, side_effects) in enumerate(_OPERATOR_KEYWORDS)
+    for keyword in keywords
+}
+
+# Words in snake_case, kebab-case and camelCase names ("getUser" -> get, user)
+_NAME_TOKEN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])")
+
+
+def _classify_capability_name(name: str) -> Tuple[OperatorType, bool]:
+    """Operator type and side effects for a capability name, by keyword"""
+    tokens = {token.lower() for token in _NAME_TOKEN.findall(name)}
+    matches = [_KEYWORD_RULES[token] for token in tokens & _KEYWORD_RULES.keys()]
+    if not matches:
+        return OperatorType.COMPUTE, True
+    _, op_type, side_effects = min(matches, key=lambda rule: rule[0])
+    return op_type, side_effects
+
+
 class BrainState(Enum):
     """Brain operational states"""
     INITIALIZING = "initializing"
@@ -40,7 +75,39 @@ class ThoughtType(Enum):
     LEARNING = "learning"      # Pattern recognition
 
 
-@dataclass
+_EXECUTABLE_CAPABILITIES = frozenset({
+    CapabilityType.TOOL, CapabilityType.FUNCTION, CapabilityType.REST_API,
+})
+
+# Memory tags, built once; memtools stores and indexes them without copying
+_TAGS_OBSERVATION = frozenset({"observation"})
+_TAGS_LEARNING = frozenset({"learning", "pattern"})
+_TAGS_PLAN = frozenset({"plan", "goal"})
+_TAGS_GOAL = frozenset({"goal"})
+_TAGS_THOUGHT_PATTERN = frozenset({"thought_pattern"})
+_THOUGHT_TAGS: Dict[ThoughtType, FrozenSet[str]] = {
+    tt: frozenset({"thought", tt.value}) for tt in ThoughtType
+}
+_THOUGHT_PATTERN_TAGS: Dict[ThoughtType, FrozenSet[str]] = {
+    tt: frozenset({"thought_pattern", tt.value}) for tt in ThoughtType
+}
+
+# Thought summaries truncate while rendering instead of stringifying
+# the whole payload and slicing
+_SUMMARY_LENGTH = 100
+_summary_repr = reprlib.Repr()
+_summary_repr.maxstring = _SUMMARY_LENGTH
+_summary_repr.maxother = _SUMMARY_LENGTH
+
+
+def _summarize(content: Any) -> str:
+    """Up to _SUMMARY_LENGTH characters describing content"""
+    if isinstance(content, str):
+        return content[:_SUMMARY_LENGTH]
+    return _summary_repr.repr(content)[:_SUMMARY_LENGTH]
+
+
+@dataclass(slots=True)
 class Thought:
     """A unit of processing in the brain"""
     thought_id: str
@@ -61,7 +128,7 @@ class Thought:
     child_thoughts: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     """A goal the brain is working toward"""
     goal_id: str
@@ -80,6 +147,92 @@ class Goal:
     completed_at: Optional[float] = None
 
 
+class _StoreBatcher:
+    """
+    Coalesces memtools stores from concurrent thoughts.
+
+    `submit()` queues the store and returns a future for its Memory. A worker
+    task takes everything already queued (up to `max_batch`, waiting at most
+    `flush_interval` for more) and writes it with one `store_many` call.
+    """
+    
+    def __init__(self, memtools: MemtoolRegistry, flush_interval: float = 0.0, max_batch: int = 64):
+        self._memtools = memtools
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """Start the worker on the running loop, if not already running there"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the worker; queued and in-flight stores are failed with CancelledError"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        self._worker = None
+    
+    def submit(self, **kwargs) -> asyncio.Future:
+        """Queue a `memtools.store(**kwargs)`; the future resolves to the Memory"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((kwargs, future))
+        return future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[tuple] = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.max_batch:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                await self._flush(batch)
+            finally:
+                # Cancelled mid-gather or mid-flush: fail what was taken so
+                # no awaiting thought hangs
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+    
+    async def _flush(self, batch: List[tuple]):
+        try:
+            results = await self._memtools.store_many(
+                [kwargs for kwargs, _ in batch], return_exceptions=True
+            )
+        except Exception as e:
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 class Brain:
     """
     Central intelligence coordinator.
@@ -88,6 +241,13 @@ class Brain:
     to create emergent intelligent behavior.
     """
     
+    MAX_THOUGHTS = 4096
+    REFLECTION_WINDOW = 10
+    STATS_TTL = 0.5
+    THOUGHT_QUEUE_SIZE = 1024
+    THOUGHT_BATCH = 32
+    THOUGHT_WORKERS = 4
+    
     def __init__(
         self,
         operators: Optional[OperatorRegistry] = None,
@@ -101,12 +261,29 @@ class Brain:
         self.discovery = discovery or get_discovery_engine()
         
         self._state = BrainState.INITIALIZING
-        self._thoughts: Dict[str, Thought] = {}
+        # Thought history, oldest first, capped at MAX_THOUGHTS
+        self._thoughts: "OrderedDict[str, Thought]" = OrderedDict()
+        # Types of the last REFLECTION_WINDOW thoughts and their counts
+        self._window: Deque[str] = deque(maxlen=self.REFLECTION_WINDOW)
+        self._window_types: Counter = Counter()
         self._goals: Dict[str, Goal] = {}
+        # Goals marked complete through set_goal/complete_goal
+        self._completed_goals = 0
         
         # Processing
-        self._thought_queue: asyncio.Queue = asyncio.Queue()
-        self._processors: List[Callable] = []
+        self._store_batcher = _StoreBatcher(self.memtools)
+        # Bounded so submit() callers feel backpressure; workers start on
+        # the first submit() and stop on suspend()
+        self._thought_queue: Optional[asyncio.Queue] = None
+        self._thought_workers: List[asyncio.Task] = []
+        self._dispatch: Dict[ThoughtType, Callable[[Thought], Awaitable[Any]]] = {
+            ThoughtType.QUERY: self._process_query,
+            ThoughtType.COMMAND: self._process_command,
+            ThoughtType.OBSERVATION: self._process_observation,
+            ThoughtType.REFLECTION: self._process_reflection,
+            ThoughtType.PLANNING: self._process_planning,
+            ThoughtType.LEARNING: self._process_learning,
+        }
         
         # Learning
         self._learning_rate: float = 0.1
@@ -115,17 +292,22 @@ class Brain:
         # Metrics
         self._total_thoughts: int = 0
         self._successful_thoughts: int = 0
-        self._start_time: float = time.time()
+        # Monotonic, so uptime is immune to wall-clock adjustments
+        self._start_time: float = time.monotonic()
+        self._stats_cache = QueryCache(max_size=1, ttl_seconds=self.STATS_TTL)
+        # Shared by stats() and reflections
+        self._memory_stats_cache = QueryCache(max_size=1, ttl_seconds=self.STATS_TTL)
     
     async def initialize(self):
         """Initialize the brain and all subsystems"""
         logger.info("Brain initializing...")
         
         # Register discovery hook to promote capabilities to operators
-        self.discovery.on_discovery(self._on_capability_discovered)
+        self.discovery.on_discovery_batch(self._on_capabilities_discovered)
         
         # Start network signal processing
         await self.network.start()
+        self._store_batcher.start()
         
         # Run initial discovery
         await self.discovery.discover_all()
@@ -137,34 +319,26 @@ class Brain:
         logger.info("Brain ready")
     
     async def _on_capability_discovered(self, capability: Capability):
-        """Promote discovered capability to operator with semantic abstraction"""
+        """Promote one discovered capability; kept for scripts/ callers"""
+        await self._on_capabilities_discovered([capability])
+    
+    async def _on_capabilities_discovered(self, capabilities: List[Capability]):
+        """Promote a discovery batch to operators with one registry update"""
+        ops = [
+            op for op in map(self._abstract_capability, capabilities)
+            if op is not None
+        ]
+        await self.operators.register_many(ops)
+    
+    def _abstract_capability(self, capability: Capability) -> Optional[OperatorSignature]:
+        """Operator for an executable capability, or None"""
         # Only promote executable capabilities
-        if capability.capability_type not in [CapabilityType.TOOL, CapabilityType.FUNCTION, CapabilityType.REST_API]:
-            return
+        if capability.capability_type not in _EXECUTABLE_CAPABILITIES:
+            return None
 
         # Abstraction: Convert raw capability to logical operator
         # 1. Heuristic Classification (Fast System 1)
-        op_type = OperatorType.COMPUTE # Default
-        side_effects = True
-        
-        name_lower = capability.name.lower()
-        desc_lower = capability.description.lower()
-        
-        if "search" in name_lower or "find" in name_lower or "query" in name_lower:
-            op_type = OperatorType.SEARCH
-            side_effects = False
-        elif "store" in name_lower or "save" in name_lower or "write" in name_lower or "upload" in name_lower:
-            op_type = OperatorType.STORE
-            side_effects = True
-        elif "read" in name_lower or "get" in name_lower or "fetch" in name_lower or "download" in name_lower:
-            op_type = OperatorType.RETRIEVE
-            side_effects = False
-        elif "send" in name_lower or "notify" in name_lower or "broadcast" in name_lower:
-            op_type = OperatorType.BROADCAST
-            side_effects = True
-        elif "embed" in name_lower:
-            op_type = OperatorType.EMBED
-            side_effects = False
+        op_type, side_effects = _classify_capability_name(capability.name)
             
         # 2. Semantic Refinement (System 2 - Future: Use LLM here)
         # If we had an active LLM operator, we would ask it to verify this classification.
@@ -186,8 +360,8 @@ class Brain:
             }
         )
         
-        await self.operators.register(op)
-        logger.info(f"Abstracted {capability.name} -> {op.operator_type.value} (Side Effects: {side_effects})")
+        logger.info("Abstracted %s -> %s (Side Effects: %s)", capability.name, op.operator_type.value, side_effects)
+        return op
 
     async def _create_core_slots(self):
         """Create core processing slots"""
@@ -214,36 +388,34 @@ class Brain:
     async def think(self, thought: Thought) -> Any:
         """Process a thought"""
         self._total_thoughts += 1
-        self._thoughts[thought.thought_id] = thought
-        self._state = BrainState.PROCESSING
+        thoughts = self._thoughts
+        thoughts[thought.thought_id] = thought
+        thoughts.move_to_end(thought.thought_id)
+        if len(thoughts) > self.MAX_THOUGHTS:
+            thoughts.popitem(last=False)
+        type_value = thought.thought_type.value
+        self._track_thought_type(type_value)
+        
+        handler = self._dispatch.get(thought.thought_type)
+        if handler is None:
+            thought.result = {"error": "Unknown thought type"}
+            thought.processed_at = time.time()
+            return thought.result
         
+        self._state = BrainState.PROCESSING
         try:
             # Store thought in memory
-            await self.memtools.store(
+            await self._store_batcher.submit(
                 content={
                     "type": "thought",
-                    "thought_type": thought.thought_type.value,
+                    "thought_type": type_value,
                     "content": thought.content,
                 },
                 memory_type="thought",
-                tags={"thought", thought.thought_type.value},
+                tags=_THOUGHT_TAGS[thought.thought_type],
             )
             
-            # Route based on thought type
-            if thought.thought_type == ThoughtType.QUERY:
-                result = await self._process_query(thought)
-            elif thought.thought_type == ThoughtType.COMMAND:
-                result = await self._process_command(thought)
-            elif thought.thought_type == ThoughtType.OBSERVATION:
-                result = await self._process_observation(thought)
-            elif thought.thought_type == ThoughtType.REFLECTION:
-                result = await self._process_reflection(thought)
-            elif thought.thought_type == ThoughtType.PLANNING:
-                result = await self._process_planning(thought)
-            elif thought.thought_type == ThoughtType.LEARNING:
-                result = await self._process_learning(thought)
-            else:
-                result = {"error": "Unknown thought type"}
+            result = await handler(thought)
             
             thought.result = result
             thought.processed_at = time.time()
@@ -262,30 +434,92 @@ class Brain:
         finally:
             self._state = BrainState.READY
     
+    async def submit(self, thought: Thought) -> Any:
+        """
+        Think a thought on the background workers and return its result.
+        
+        Waits while THOUGHT_QUEUE_SIZE thoughts are already queued. Workers
+        take up to THOUGHT_BATCH queued thoughts at a time and think them
+        concurrently.
+        """
+        self._start_thought_workers()
+        future = asyncio.get_running_loop().create_future()
+        await self._thought_queue.put((thought, future))
+        return await future
+    
+    def _start_thought_workers(self):
+        loop = asyncio.get_running_loop()
+        self._thought_workers = [
+            t for t in self._thought_workers if not t.done() and t.get_loop() is loop
+        ]
+        if not self._thought_workers:
+            self._thought_queue = asyncio.Queue(maxsize=self.THOUGHT_QUEUE_SIZE)
+        for _ in range(self.THOUGHT_WORKERS - len(self._thought_workers)):
+            self._thought_workers.append(loop.create_task(self._thought_worker()))
+    
+    async def _stop_thought_workers(self):
+        """Stop the workers; queued and in-flight thoughts fail with CancelledError"""
+        workers, self._thought_workers = self._thought_workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        queue = self._thought_queue
+        while queue is not None and not queue.empty():
+            _, future = queue.get_nowait()
+            future.cancel()
+    
+    async def _thought_worker(self):
+        queue = self._thought_queue
+        while True:
+            batch: List[tuple] = []
+            try:
+                batch.append(await queue.get())
+                while len(batch) < self.THOUGHT_BATCH and not queue.empty():
+                    batch.append(queue.get_nowait())
+                results = await asyncio.gather(
+                    *(self.think(thought) for thought, _ in batch),
+                    return_exceptions=True,
+                )
+                for (_, future), result in zip(batch, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+            finally:
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+    
     async def _process_query(self, thought: Thought) -> Any:
         """Process a query thought"""
         query = thought.content
+        query_text = query if isinstance(query, str) else None
         
         # Search memory first
         memories = await self.memtools.recall(
-            query=str(query) if isinstance(query, str) else None,
+            query=query_text,
             limit=5,
         )
         
         # Search capabilities
         capabilities = self.discovery.search_capabilities(
-            name=str(query) if isinstance(query, str) else None,
+            name=query_text,
             healthy_only=True,
         )
         
         # Send through network
         signal = Signal(
             signal_id=f"sig_{thought.thought_id}",
-            signal_type="query",
-            payload={"query": query, "memories": [m.to_dict() for m in memories]},
-            source="brain_query",
+            signal_type=SignalType.QUERY,
+            source_slot="brain_query",
+            target_slot=None,
+            # In-process consumers read the Memory objects directly; operator
+            # invocation serializes them if the payload leaves the process
+            payload={"query": query, "memories": memories},
         )
-        await self.network.emit(signal)
+        await self.network.send_signal(signal)
         
         return {
             "query": query,
@@ -317,27 +551,28 @@ class Brain:
         """Process an observation thought"""
         observation = thought.content
         
-        # Store observation
-        memory = await self.memtools.store(
-            content=observation,
-            memory_type="observation",
-            importance=0.6,
-            tags={"observation"},
-        )
-        
-        # Check for patterns
-        patterns = await self.memtools.match_patterns(
-            {"type": "observation", "content": observation}
-        )
-        
         # Signal observation to network
         signal = Signal(
             signal_id=f"sig_{thought.thought_id}",
-            signal_type="observation",
+            signal_type=SignalType.BROADCAST,
+            source_slot="external",
+            target_slot=None,
             payload=observation,
-            source="external",
         )
-        await self.network.emit(signal)
+        
+        # Store, pattern matching and signalling are independent; overlap them
+        memory, patterns, _ = await asyncio.gather(
+            self._store_batcher.submit(
+                content=observation,
+                memory_type="observation",
+                importance=0.6,
+                tags=_TAGS_OBSERVATION,
+            ),
+            self.memtools.match_patterns(
+                {"type": "observation", "content": observation}
+            ),
+            self.network.send_signal(signal),
+        )
         
         return {
             "observed": True,
@@ -345,45 +580,34 @@ class Brain:
             "patterns_matched": len(patterns),
         }
     
+    def _track_thought_type(self, thought_type: str):
+        """Slide the reflection window forward by one thought"""
+        window, counts = self._window, self._window_types
+        if len(window) == window.maxlen:
+            evicted = window[0]
+            counts[evicted] -= 1
+            if not counts[evicted]:
+                del counts[evicted]
+        window.append(thought_type)
+        counts[thought_type] += 1
+    
     async def _process_reflection(self, thought: Thought) -> Any:
         """Process a reflection thought"""
-        # Analyze recent thoughts
-        recent_thoughts = sorted(
-            self._thoughts.values(),
-            key=lambda t: t.created_at,
-            reverse=True,
-        )[:10]
-        
-        # Check thought patterns
-        thought_types = {}
-        for t in recent_thoughts:
-            tt = t.thought_type.value
-            thought_types[tt] = thought_types.get(tt, 0) + 1
-        
-        # Calculate success rate
-        success_rate = (
-            self._successful_thoughts / self._total_thoughts
-            if self._total_thoughts > 0 else 1.0
-        )
-        
         # Memory stats
-        memory_stats = self.memtools.stats()
+        memory_stats = self._memory_stats()
         
         return {
             "total_thoughts": self._total_thoughts,
-            "success_rate": success_rate,
-            "thought_distribution": thought_types,
+            "success_rate": self.success_rate,
+            "thought_distribution": dict(self._window_types),
             "memory_stats": memory_stats,
-            "uptime_seconds": time.time() - self._start_time,
+            "uptime_seconds": time.monotonic() - self._start_time,
         }
     
     async def _process_planning(self, thought: Thought) -> Any:
         """Process a planning thought"""
         plan_request = thought.content
         
-        # Get current goals
-        active_goals = [g for g in self._goals.values() if not g.is_complete]
-        
         # Search for relevant capabilities
         capabilities = self.discovery.search_capabilities(
             healthy_only=True,
@@ -391,13 +615,13 @@ class Brain:
         
         # Recall relevant memories
         memories = await self.memtools.recall(
-            tags={"plan", "goal"},
+            tags=_TAGS_PLAN,
             limit=5,
         )
         
         return {
             "planning_context": plan_request,
-            "active_goals": len(active_goals),
+            "active_goals": len(self._goals) - self._completed_goals,
             "available_capabilities": len(capabilities),
             "relevant_memories": len(memories),
         }
@@ -439,19 +663,15 @@ class Brain:
         
         learning_content = thought.content
         
-        # Recognize patterns
-        pattern = await self.memtools.recognize_pattern(
+        # Recognize the pattern and store the learning in one write
+        pattern, memory = await self.memtools.store_with_pattern(
+            content=learning_content,
             pattern_type="learned",
             trigger_conditions=learning_content.get("trigger", {}),
             response_template=learning_content.get("response"),
-        )
-        
-        # Store learning
-        memory = await self.memtools.store(
-            content=learning_content,
             memory_type="learning",
             importance=0.8,
-            tags={"learning", "pattern"},
+            tags=_TAGS_LEARNING,
         )
         
         self._state = BrainState.READY
@@ -479,39 +699,46 @@ class Brain:
             if operator_id:
                 await self._learn_from_outcome(operator_id, thought.result)
 
-        await self.memtools.store(
+        await self._store_batcher.submit(
             content={
                 "thought_type": thought.thought_type.value,
-                "input_summary": str(thought.content)[:100],
+                "input_summary": _summarize(thought.content),
                 "processing_time": processing_time,
                 "success": True,
             },
             memory_type="thought_pattern",
             importance=0.4,
-            tags={"thought_pattern", thought.thought_type.value},
+            tags=_THOUGHT_PATTERN_TAGS[thought.thought_type],
         )
     
     async def set_goal(self, goal: Goal):
         """Set a new goal"""
+        replaced = self._goals.get(goal.goal_id)
+        if replaced is not None and replaced.is_complete:
+            self._completed_goals -= 1
+        if goal.is_complete:
+            self._completed_goals += 1
         self._goals[goal.goal_id] = goal
         
         await self.memtools.store(
             content={"goal_id": goal.goal_id, "description": goal.description},
             memory_type="goal",
             importance=goal.priority,
-            tags={"goal"},
+            tags=_TAGS_GOAL,
         )
         
-        logger.info(f"Goal set: {goal.description}")
+        logger.info("Goal set: %s", goal.description)
     
     async def complete_goal(self, goal_id: str):
         """Mark a goal as complete"""
         if goal_id in self._goals:
             goal = self._goals[goal_id]
+            if not goal.is_complete:
+                self._completed_goals += 1
             goal.is_complete = True
             goal.completed_at = time.time()
             goal.progress = 1.0
-            logger.info(f"Goal completed: {goal.description}")
+            logger.info("Goal completed: %s", goal.description)
     
     async def adapt(self):
         """Trigger adaptation based on experience"""
@@ -520,7 +747,7 @@ class Brain:
         try:
             # Analyze patterns
             patterns = await self.memtools.recall(
-                tags={"thought_pattern"},
+                tags=_TAGS_THOUGHT_PATTERN,
                 limit=100,
             )
             
@@ -533,7 +760,7 @@ class Brain:
             # Re-run discovery
             await self.discovery.discover_all()
             
-            logger.info(f"Adaptation complete. Forgotten {forgotten} memories.")
+            logger.info("Adaptation complete. Forgotten %d memories.", forgotten)
             
         finally:
             self._state = BrainState.READY
@@ -542,14 +769,24 @@ class Brain:
         """Suspend brain operations"""
         self._state = BrainState.SUSPENDED
         await self.network.stop()
+        await self._stop_thought_workers()
+        await self._store_batcher.stop()
         logger.info("Brain suspended")
     
     async def resume(self):
         """Resume brain operations"""
         await self.network.start()
+        self._store_batcher.start()
         self._state = BrainState.READY
         logger.info("Brain resumed")
     
+    @property
+    def success_rate(self) -> float:
+        """Share of thoughts processed without error (1.0 before any)"""
+        if self._total_thoughts == 0:
+            return 1.0
+        return self._successful_thoughts / self._total_thoughts
+    
     @property
     def thoughts(self) -> List[Thought]:
         return list(self._thoughts.values())
@@ -563,19 +800,31 @@ class Brain:
         return self._state
     
     def stats(self) -> Dict:
-        """Get brain statistics"""
+        """Get brain statistics, recomputed at most every STATS_TTL seconds"""
+        stats = self._stats_cache.get(None)
+        if stats is None:
+            stats = self._compute_stats()
+            self._stats_cache.put(None, stats)
+        return stats
+    
+    def _memory_stats(self) -> Dict:
+        """memtools.stats(), recomputed at most every STATS_TTL seconds"""
+        stats = self._memory_stats_cache.get(None)
+        if stats is None:
+            stats = self.memtools.stats()
+            self._memory_stats_cache.put(None, stats)
+        return stats
+    
+    def _compute_stats(self) -> Dict:
         return {
             "state": self._state.value,
-            "uptime_seconds": time.time() - self._start_time,
+            "uptime_seconds": time.monotonic() - self._start_time,
             "total_thoughts": self._total_thoughts,
             "successful_thoughts": self._successful_thoughts,
-            "success_rate": (
-                self._successful_thoughts / self._total_thoughts
-                if self._total_thoughts > 0 else 1.0
-            ),
-            "active_goals": len([g for g in self._goals.values() if not g.is_complete]),
-            "completed_goals": len([g for g in self._goals.values() if g.is_complete]),
-            "memory_stats": self.memtools.stats(),
+            "success_rate": self.success_rate,
+            "active_goals": len(self._goals) - self._completed_goals,
+            "completed_goals": self._completed_goals,
+            "memory_stats": self._memory_stats(),
             "network_stats": {
                 "slots": len(self.network.slots),
             },
@@ -5,13 +5,17 @@ Probes external systems and APIs to discover available capabilities.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from enum import Enum
 import time
 import logging
 import asyncio
+import base64
 import hashlib
 import json
+import shlex
+
+from .query_cache import QueryCache
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,67 @@ except ImportError:
     MCP_AVAILABLE = False
     logger.warning("MCP client libraries not available. MCP discovery will be disabled.")
 
+# httpx negotiates HTTP/2 only when h2 is installed
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Probe failures that only mean "nothing there"; anything else is logged loudly
+try:
+    import httpx
+    _EXPECTED_PROBE_ERRORS: Tuple[type, ...] = (
+        httpx.TimeoutException, httpx.ConnectError, TimeoutError, ConnectionError,
+    )
+except ImportError:
+    _EXPECTED_PROBE_ERRORS = (TimeoutError, ConnectionError)
+
+# Stream OpenAPI paths instead of decoding whole specs when ijson is installed
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Specs can run to megabytes; orjson decodes response bytes directly and its
+# JSONDecodeError subclasses ValueError like the stdlib error.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Sent as-is on every GraphQL discovery pass
+_INTROSPECTION_QUERY = """
+query {
+    __schema {
+        queryType { name fields { name description args { name type { name } } } }
+        mutationType { name fields { name description args { name type { name } } } }
+    }
+}
+"""
+_INTROSPECTION_BODY = json.dumps({"query": _INTROSPECTION_QUERY}).encode()
+
+
+def _cap_hasher(prefix: str = ""):
+    """Hash state primed with a prefix shared by many capability ids"""
+    return hashlib.sha256(prefix.encode())
+
+
+def _cap_hash(*parts: str, prefix=None) -> str:
+    """
+    12 hex chars identifying a capability (not a security boundary).
+    
+    The id is the truncated SHA-256 of the concatenated parts, continuing
+    from a `_cap_hasher` prefix state when given. Ids double as persisted
+    operator ids, so the scheme must not change.
+    """
+    h = prefix.copy() if prefix is not None else _cap_hasher()
+    for part in parts:
+        h.update(part.encode())
+    return h.hexdigest()[:12]
+
 
 class CapabilityType(Enum):
     """Types of discoverable capabilities"""
@@ -40,6 +105,10 @@ class CapabilityType(Enum):
     STREAM = "stream"
 
 
+# Value -> member, avoiding the Enum constructor's lookup machinery per item
+_CAPABILITY_TYPES: Dict[str, CapabilityType] = {t.value: t for t in CapabilityType}
+
+
 class DiscoveryMethod(Enum):
     """Methods for discovering capabilities"""
     OPENAPI = "openapi"       # OpenAPI/Swagger spec
@@ -51,7 +120,7 @@ class DiscoveryMethod(Enum):
     MCP = "mcp"               # Model Context Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class Capability:
     """A discovered capability"""
     capability_id: str
@@ -111,7 +180,7 @@ class Capability:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoverySource:
     """A source for capability discovery"""
     source_id: str
@@ -131,6 +200,62 @@ class DiscoverySource:
     last_discovery: float = 0.0
     capabilities_found: int = 0
     is_active: bool = True
+    
+    # Built on first use; cleared by set_auth()
+    _auth_headers: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (command, args) for stdio MCP sources, parsed from base_url on first use
+    _command: Optional[Tuple[str, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Last successfully parsed spec/manifest and its HTTP validators, so an
+    # unchanged document is neither re-downloaded nor re-parsed
+    _cached_caps: Optional[List["Capability"]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _etag: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _last_modified: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _content_hash: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def set_auth(self, auth_type: str, auth_credentials: Optional[Dict[str, str]]):
+        """Change credentials; auth headers are rebuilt on next use"""
+        self.auth_type = auth_type
+        self.auth_credentials = auth_credentials
+        self._auth_headers = None
+
+
+def _safe_hook(hook: Callable) -> Callable:
+    """Wrap a discovery hook so its errors are logged instead of raised"""
+    async def wrapped(arg):
+        try:
+            await hook(arg)
+        except Exception as e:
+            logger.error(f"Discovery hook error: {e}")
+    return wrapped
+
+
+class _NotModified(Exception):
+    """The source's document is unchanged since its capabilities were cached"""
+
+
+class _AsyncByteReader:
+    """Async file-like read() over a byte stream, as ijson expects"""
+    
+    def __init__(self, chunks):
+        self._chunks = chunks.__aiter__()
+        self._buffer = b""
+    
+    async def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
 
 
 class DiscoveryEngine:
@@ -140,11 +265,37 @@ class DiscoveryEngine:
     Probes sources to discover and catalog available capabilities.
     """
     
-    def __init__(self, http_client=None):
+    DECISION_CACHE_SIZE = 4096
+    # Also bounds how long a decision can outlive a kernel policy time window
+    DECISION_TTL = 300.0
+    
+    def __init__(self, http_client=None, max_inflight: int = 64):
         self._sources: Dict[str, DiscoverySource] = {}
         self._capabilities: Dict[str, Capability] = {}
+        # Secondary indices: capability ids by type and by tag
+        self._by_type: Dict[CapabilityType, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        # Registration sequence per id, to order index results without
+        # walking the whole registry
+        self._seq: Dict[str, int] = {}
+        # Running count for stats(); kept in step by _register_capability/_set_health
+        self._healthy_count = 0
+        # Healthy capabilities, rebuilt lazily after registration/health changes
+        self._healthy: Optional[List[Capability]] = None
+        # Bumped on every registration or health flip, so cached capability
+        # listings keyed on it go stale automatically
+        self.version = 0
         self._http = http_client  # HTTP client for probing
         self._discovery_hooks: List[Callable] = []
+        self._batch_hooks: List[Callable] = []
+        # Bounds concurrent kernel checks and hook calls during a discovery burst
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self.probe_failures = 0
+        # Kernel registration decisions by (type, endpoint, method, source,
+        # policy version); MCP tools of one source share all of these
+        self._register_decisions = QueryCache(
+            max_size=self.DECISION_CACHE_SIZE, ttl_seconds=self.DECISION_TTL
+        )
     
     def register_source(self, source: DiscoverySource):
         """Register a discovery source"""
@@ -153,24 +304,33 @@ class DiscoveryEngine:
     
     def on_discovery(self, hook: Callable):
         """Register hook for when capabilities are discovered"""
-        self._discovery_hooks.append(hook)
+        self._discovery_hooks.append(_safe_hook(hook))
+    
+    def on_discovery_batch(self, hook: Callable):
+        """Register hook called once per source with all newly registered capabilities"""
+        self._batch_hooks.append(_safe_hook(hook))
     
     async def discover_all(self) -> Dict[str, List[Capability]]:
-        """Run discovery on all sources"""
-        results = {}
+        """Run discovery on all active sources concurrently"""
+        sources = [s for s in self._sources.values() if s.is_active]
+        # A source may not take longer than its own refresh period
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(self.discover_from_source(s), timeout=s.refresh_interval)
+                for s in sources
+            ),
+            return_exceptions=True,
+        )
         
-        for source_id, source in self._sources.items():
-            if not source.is_active:
+        results = {}
+        for source, outcome in zip(sources, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Discovery failed for {source.source_id}: {outcome!r}")
+                results[source.source_id] = []
                 continue
-            
-            try:
-                capabilities = await self.discover_from_source(source)
-                results[source_id] = capabilities
-                source.last_discovery = time.time()
-                source.capabilities_found = len(capabilities)
-            except Exception as e:
-                logger.error(f"Discovery failed for {source_id}: {e}")
-                results[source_id] = []
+            results[source.source_id] = outcome
+            source.last_discovery = time.time()
+            source.capabilities_found = len(outcome)
         
         return results
     
@@ -190,38 +350,101 @@ class DiscoveryEngine:
             capabilities = await self._discover_mcp(source)
         
         # Register discovered capabilities
-        for cap in capabilities:
-            # Kernel-level enforcement (global guardrails)
-            try:
-                from security.kernel import get_kernel_enforcer
-
-                enforcer = get_kernel_enforcer()
-                decision = await enforcer.enforce_discovery_register(
-                    capability_type=cap.capability_type.value,
-                    endpoint=cap.endpoint,
-                    method=cap.method,
-                    actor_context={"source_id": source.source_id},
-                )
-                if not decision.allowed:
-                    logger.warning(f"Discovery rejected capability {cap.capability_id}: {decision.reason}")
-                    continue
-            except Exception as e:
-                # Fail-safe: if enforcement crashes, do not register new capabilities.
-                logger.error(f"Kernel enforcement error during discovery: {e}")
+        registered = []
+        candidates = capabilities
+        try:
+            from security.kernel import get_kernel_enforcer
+            enforcer = get_kernel_enforcer()
+            policy_version = enforcer.policy_version
+        except Exception as e:
+            # Fail-safe: if enforcement is unavailable, do not register new capabilities.
+            logger.error(f"Kernel enforcement error during discovery: {e}")
+            candidates = []
+        
+        # Kernel-level enforcement (global guardrails): one check per distinct
+        # (type, endpoint, method) not already decided, all run concurrently
+        keys = [
+            (cap.capability_type.value, cap.endpoint, cap.method, source.source_id, policy_version)
+            for cap in candidates
+        ]
+        decisions = {key: self._register_decisions.get(key) for key in keys}
+        pending = [key for key, decision in decisions.items() if decision is None]
+        if pending:
+            results = await asyncio.gather(
+                *(self._bounded(self._decide_register(enforcer, key)) for key in pending)
+            )
+            decisions.update(zip(pending, results))
+        
+        for cap, key in zip(candidates, keys):
+            decision = decisions[key]
+            if decision is None:
+                continue  # Fail-safe: enforcement crashed, do not register
+            if not decision.allowed:
+                logger.warning(f"Discovery rejected capability {cap.capability_id}: {decision.reason}")
                 continue
 
-            self._capabilities[cap.capability_id] = cap
-            
-            # Notify hooks
-            for hook in self._discovery_hooks:
-                try:
-                    await hook(cap)
-                except Exception as e:
-                    logger.error(f"Discovery hook error: {e}")
+            self._register_capability(cap)
+            registered.append(cap)
+        
+        # Notify hooks; they are independent, so they run concurrently
+        if registered:
+            await asyncio.gather(
+                *(self._bounded(hook(cap)) for cap in registered for hook in self._discovery_hooks),
+                *(self._bounded(hook(registered)) for hook in self._batch_hooks),
+            )
         
         logger.info(f"Discovered {len(capabilities)} capabilities from {source.name}")
         return capabilities
     
+    async def _bounded(self, awaitable):
+        async with self._inflight:
+            return await awaitable
+    
+    async def _decide_register(self, enforcer, key: Tuple):
+        """Kernel registration decision for a key, cached; None if enforcement failed"""
+        capability_type, endpoint, method, source_id, _ = key
+        try:
+            decision = await enforcer.enforce_discovery_register(
+                capability_type=capability_type,
+                endpoint=endpoint,
+                method=method,
+                actor_context={"source_id": source_id},
+            )
+        except Exception as e:
+            logger.error(f"Kernel enforcement error during discovery: {e}")
+            return None
+        self._register_decisions.put(key, decision)
+        return decision
+    
+    def _register_capability(self, cap: Capability):
+        """Add or replace a capability and keep the indices in step"""
+        previous = self._capabilities.get(cap.capability_id)
+        if previous is not None:
+            self._healthy_count -= previous.is_healthy
+            self._by_type[previous.capability_type].discard(cap.capability_id)
+            for tag in previous.tags:
+                self._by_tag[tag].discard(cap.capability_id)
+        
+        self._capabilities[cap.capability_id] = cap
+        self._seq.setdefault(cap.capability_id, len(self._seq))
+        self._by_type.setdefault(cap.capability_type, set()).add(cap.capability_id)
+        for tag in cap.tags:
+            self._by_tag.setdefault(tag, set()).add(cap.capability_id)
+        self._healthy_count += cap.is_healthy
+        self._healthy = None
+        self.version += 1
+    
+    def _set_health(self, cap: Capability, healthy: bool):
+        """Record a health result, updating the count and healthy cache on a flip"""
+        if cap.is_healthy == healthy:
+            return
+        cap.is_healthy = healthy
+        # A capability replaced mid-check no longer counts
+        if self._capabilities.get(cap.capability_id) is cap:
+            self._healthy_count += 1 if healthy else -1
+            self._healthy = None
+            self.version += 1
+    
     async def _discover_mcp(self, source: DiscoverySource) -> List[Capability]:
         """Discover capabilities from an MCP server"""
         if not MCP_AVAILABLE:
@@ -244,6 +467,7 @@ class DiscoveryEngine:
                         result = await session.list_tools()
                         tools = result.tools
                         
+                        now = time.time()
                         for tool in tools:
                             cap = Capability(
                                 capability_id=f"mcp-{source.source_id}-{tool.name}",
@@ -255,6 +479,7 @@ class DiscoveryEngine:
                                 description=tool.description or "",
                                 discovery_method=DiscoveryMethod.MCP,
                                 source=source.source_id,
+                                discovered_at=now,
                                 tags={"mcp", "tool"}
                             )
                             capabilities.append(cap)
@@ -265,11 +490,11 @@ class DiscoveryEngine:
             else:
                 # Assume command line for stdio
                 # base_url might be "npx -y @modelcontextprotocol/server-filesystem /path"
-                # We need to parse it.
-                import shutil
-                parts = source.base_url.split(" ")
-                command = parts[0]
-                args = parts[1:]
+                # Shell-style parsing keeps quoted paths with spaces intact.
+                if source._command is None:
+                    command, *args = shlex.split(source.base_url)
+                    source._command = (command, args)
+                command, args = source._command
                 
                 # Security check: only allow specific commands or paths?
                 # For now, we assume the source is trusted if configured by admin.
@@ -290,6 +515,7 @@ class DiscoveryEngine:
                         result = await session.list_tools()
                         tools = result.tools
                         
+                        now = time.time()
                         for tool in tools:
                             cap = Capability(
                                 capability_id=f"mcp-{source.source_id}-{tool.name}",
@@ -301,6 +527,7 @@ class DiscoveryEngine:
                                 description=tool.description or "",
                                 discovery_method=DiscoveryMethod.MCP,
                                 source=source.source_id,
+                                discovered_at=now,
                                 tags={"mcp", "tool", "stdio"}
                             )
                             capabilities.append(cap)
@@ -320,31 +547,79 @@ class DiscoveryEngine:
         url = f"{source.base_url.rstrip('/')}/{source.discovery_path.lstrip('/')}"
         
         try:
-            response = await self._http.get(
-                url,
-                headers=self._get_auth_headers(source),
-            )
-            spec = response.json()
-            
-            paths = spec.get("paths", {})
-            for path, methods in paths.items():
+            now = time.time()
+            id_prefix = _cap_hasher(source.base_url)
+            async for path, methods in self._openapi_paths(source, url):
                 for method, details in methods.items():
                     if method in ("get", "post", "put", "delete", "patch"):
                         cap = self._parse_openapi_operation(
-                            source, path, method.upper(), details
+                            source, path, method.upper(), details, id_prefix, now
                         )
                         capabilities.append(cap)
+            source._cached_caps = capabilities
+        except _NotModified:
+            return list(source._cached_caps)
         except Exception as e:
+            source._cached_caps = None
             logger.error(f"OpenAPI discovery failed: {e}")
         
         return capabilities
     
+    async def _openapi_paths(self, source: DiscoverySource, url: str):
+        """Yield (path, methods) from an OpenAPI spec, streamed when ijson is installed"""
+        headers = self._conditional_headers(source)
+        if IJSON_AVAILABLE and hasattr(self._http, "stream"):
+            async with self._http.stream("GET", url, headers=headers) as response:
+                self._check_modified(source, response)
+                reader = _AsyncByteReader(response.aiter_bytes())
+                async for item in ijson.kvitems_async(reader, "paths", use_float=True):
+                    yield item
+            return
+        
+        response = await self._http.get(url, headers=headers)
+        self._check_modified(source, response, response.content)
+        for item in _json_loads(response.content).get("paths", {}).items():
+            yield item
+    
+    def _conditional_headers(self, source: DiscoverySource) -> Dict[str, str]:
+        """Auth headers plus validators for the cached document, if any"""
+        headers = self._get_auth_headers(source)
+        if source._cached_caps is None:
+            return headers
+        validators = {}
+        if source._etag:
+            validators["If-None-Match"] = source._etag
+        if source._last_modified:
+            validators["If-Modified-Since"] = source._last_modified
+        return {**headers, **validators} if validators else headers
+    
+    def _check_modified(self, source: DiscoverySource, response, content: Optional[bytes] = None):
+        """
+        Raise _NotModified if the response repeats the cached document,
+        otherwise record its validators.
+        
+        Without ETag/Last-Modified, a digest of the body (when given) stands in.
+        """
+        if source._cached_caps is not None and response.status_code == 304:
+            raise _NotModified
+        source._etag = response.headers.get("etag")
+        source._last_modified = response.headers.get("last-modified")
+        if content is None or source._etag or source._last_modified:
+            source._content_hash = None
+            return
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if source._cached_caps is not None and digest == source._content_hash:
+            raise _NotModified
+        source._content_hash = digest
+    
     def _parse_openapi_operation(
         self,
         source: DiscoverySource,
         path: str,
         method: str,
         details: Dict,
+        id_prefix=None,
+        discovered_at: Optional[float] = None,
     ) -> Capability:
         """Parse OpenAPI operation into capability"""
         operation_id = details.get("operationId", f"{method}_{path}".replace("/", "_"))
@@ -364,7 +639,7 @@ class DiscoveryEngine:
                 output_schema = content["application/json"].get("schema", {})
         
         return Capability(
-            capability_id=f"cap_{hashlib.sha256(f'{source.base_url}{path}{method}'.encode()).hexdigest()[:12]}",
+            capability_id=f"cap_{_cap_hash(path, method, prefix=id_prefix or _cap_hasher(source.base_url))}",
             name=operation_id,
             capability_type=CapabilityType.REST_API,
             endpoint=f"{source.base_url.rstrip('/')}{path}",
@@ -375,6 +650,7 @@ class DiscoveryEngine:
             tags=set(details.get("tags", [])),
             discovery_method=DiscoveryMethod.OPENAPI,
             source=source.source_id,
+            discovered_at=discovered_at or time.time(),
         )
     
     async def _discover_graphql(self, source: DiscoverySource) -> List[Capability]:
@@ -384,23 +660,16 @@ class DiscoveryEngine:
         if not self._http:
             return capabilities
         
-        introspection_query = """
-        query {
-            __schema {
-                queryType { name fields { name description args { name type { name } } } }
-                mutationType { name fields { name description args { name type { name } } } }
-            }
-        }
-        """
-        
         try:
             url = f"{source.base_url.rstrip('/')}/{source.discovery_path.lstrip('/')}"
             response = await self._http.post(
                 url,
-                json={"query": introspection_query},
-                headers=self._get_auth_headers(source),
+                content=_INTROSPECTION_BODY,
+                headers={**self._get_auth_headers(source), "Content-Type": "application/json"},
             )
-            schema = response.json().get("data", {}).get("__schema", {})
+            schema = _json_loads(response.content).get("data", {}).get("__schema", {})
+            
+            now = time.time()
             
             # Parse queries
             for field in schema.get("queryType", {}).get("fields", []):
@@ -413,6 +682,7 @@ class DiscoveryEngine:
                     description=field.get("description", ""),
                     discovery_method=DiscoveryMethod.GRAPHQL_INTROSPECT,
                     source=source.source_id,
+                    discovered_at=now,
                 )
                 capabilities.append(cap)
             
@@ -427,6 +697,7 @@ class DiscoveryEngine:
                     description=field.get("description", ""),
                     discovery_method=DiscoveryMethod.GRAPHQL_INTROSPECT,
                     source=source.source_id,
+                    discovered_at=now,
                 )
                 capabilities.append(cap)
         except Exception as e:
@@ -450,34 +721,47 @@ class DiscoveryEngine:
             "/rpc",
         ]
         
-        for path in probe_paths:
-            try:
-                url = f"{source.base_url.rstrip('/')}{path}"
-                start = time.time()
-                response = await self._http.get(
-                    url,
-                    headers=self._get_auth_headers(source),
-                    timeout=5.0,
+        base_url = source.base_url.rstrip("/")
+        headers = self._get_auth_headers(source)
+        outcomes = await asyncio.gather(
+            *(self._timed_get(f"{base_url}{path}", headers, 5.0) for path in probe_paths),
+            return_exceptions=True,
+        )
+        
+        now = time.time()
+        id_prefix = _cap_hasher(base_url)
+        for path, outcome in zip(probe_paths, outcomes):
+            if isinstance(outcome, Exception):
+                self.probe_failures += 1
+                if isinstance(outcome, _EXPECTED_PROBE_ERRORS):
+                    logger.debug("Probe %s%s failed: %r", base_url, path, outcome)
+                else:
+                    logger.warning("Probe %s%s failed: %r", base_url, path, outcome)
+                continue
+            response, response_time = outcome
+            if response.status_code < 400:
+                url = f"{base_url}{path}"
+                cap = Capability(
+                    capability_id=f"probe_{_cap_hash(path, prefix=id_prefix)}",
+                    name=f"endpoint_{path.strip('/').replace('/', '_')}",
+                    capability_type=CapabilityType.REST_API,
+                    endpoint=url,
+                    method="GET",
+                    discovery_method=DiscoveryMethod.PROBE,
+                    source=source.source_id,
+                    discovered_at=now,
+                    response_time_ms=response_time,
                 )
-                response_time = (time.time() - start) * 1000
-                
-                if response.status_code < 400:
-                    cap = Capability(
-                        capability_id=f"probe_{hashlib.sha256(url.encode()).hexdigest()[:12]}",
-                        name=f"endpoint_{path.strip('/').replace('/', '_')}",
-                        capability_type=CapabilityType.REST_API,
-                        endpoint=url,
-                        method="GET",
-                        discovery_method=DiscoveryMethod.PROBE,
-                        source=source.source_id,
-                        response_time_ms=response_time,
-                    )
-                    capabilities.append(cap)
-            except Exception:
-                pass  # Probing failure is expected for some paths
+                capabilities.append(cap)
         
         return capabilities
     
+    async def _timed_get(self, url: str, headers: Dict[str, str], timeout: float):
+        """GET url; returns (response, elapsed milliseconds)"""
+        start = time.monotonic()
+        response = await self._http.get(url, headers=headers, timeout=timeout)
+        return response, (time.monotonic() - start) * 1000
+    
     async def _discover_manifest(self, source: DiscoverySource) -> List[Capability]:
         """Discover from JSON manifest"""
         capabilities = []
@@ -489,15 +773,17 @@ class DiscoveryEngine:
             url = f"{source.base_url.rstrip('/')}/{source.discovery_path.lstrip('/')}"
             response = await self._http.get(
                 url,
-                headers=self._get_auth_headers(source),
+                headers=self._conditional_headers(source),
             )
-            manifest = response.json()
+            self._check_modified(source, response, response.content)
+            manifest = _json_loads(response.content)
             
+            now = time.time()
             for item in manifest.get("capabilities", []):
                 cap = Capability(
-                    capability_id=item.get("id", f"man_{hashlib.sha256(item['name'].encode()).hexdigest()[:12]}"),
+                    capability_id=item["id"] if "id" in item else f"man_{_cap_hash(item['name'])}",
                     name=item["name"],
-                    capability_type=CapabilityType(item.get("type", "rest_api")),
+                    capability_type=_CAPABILITY_TYPES[item.get("type", "rest_api")],
                     endpoint=item.get("endpoint", source.base_url),
                     method=item.get("method", "POST"),
                     input_schema=item.get("input_schema", {}),
@@ -506,15 +792,25 @@ class DiscoveryEngine:
                     tags=set(item.get("tags", [])),
                     discovery_method=DiscoveryMethod.MANIFEST,
                     source=source.source_id,
+                    discovered_at=now,
                 )
                 capabilities.append(cap)
+            source._cached_caps = capabilities
+        except _NotModified:
+            return list(source._cached_caps)
         except Exception as e:
+            source._cached_caps = None
             logger.error(f"Manifest discovery failed: {e}")
         
         return capabilities
     
     def _get_auth_headers(self, source: DiscoverySource) -> Dict[str, str]:
-        """Get authentication headers for source"""
+        """Authentication headers for source, built once; callers must not mutate them"""
+        if source._auth_headers is None:
+            source._auth_headers = self._build_auth_headers(source)
+        return source._auth_headers
+    
+    def _build_auth_headers(self, source: DiscoverySource) -> Dict[str, str]:
         if source.auth_type == "none" or not source.auth_credentials:
             return {}
         
@@ -524,7 +820,6 @@ class DiscoveryEngine:
         elif source.auth_type == "bearer":
             return {"Authorization": f"Bearer {source.auth_credentials.get('token', '')}"}
         elif source.auth_type == "basic":
-            import base64
             creds = f"{source.auth_credentials.get('username', '')}:{source.auth_credentials.get('password', '')}"
             encoded = base64.b64encode(creds.encode()).decode()
             return {"Authorization": f"Basic {encoded}"}
@@ -549,19 +844,19 @@ class DiscoveryEngine:
                 timeout=10.0,
             )
             cap.response_time_ms = (time.time() - start) * 1000
-            cap.is_healthy = response.status_code < 500
+            healthy = response.status_code < 500
             cap.last_health_check = time.time()
         except Exception:
-            cap.is_healthy = False
+            healthy = False
         
-        return cap.is_healthy
+        self._set_health(cap, healthy)
+        return healthy
     
     async def health_check_all(self) -> Dict[str, bool]:
-        """Check health of all capabilities"""
-        results = {}
-        for cap_id in self._capabilities:
-            results[cap_id] = await self.health_check(cap_id)
-        return results
+        """Check health of all capabilities concurrently"""
+        cap_ids = list(self._capabilities)
+        healthy = await asyncio.gather(*(self.health_check(cap_id) for cap_id in cap_ids))
+        return dict(zip(cap_ids, healthy))
     
     def get_capability(self, capability_id: str) -> Optional[Capability]:
         """Get capability by ID"""
@@ -574,37 +869,87 @@ class DiscoveryEngine:
         tags: Optional[Set[str]] = None,
         healthy_only: bool = False,
     ) -> List[Capability]:
-        """Search for capabilities"""
-        results = list(self._capabilities.values())
+        """
+        Search for capabilities.
         
-        if name:
-            results = [c for c in results if name.lower() in c.name.lower()]
+        An unfiltered healthy_only search returns the shared cached list;
+        callers must not mutate it.
+        """
+        if healthy_only and not (name or capability_type or tags):
+            return self.healthy_capabilities()
         
+        # Narrow by the type/tag indices before touching any capability
+        ids: Optional[Set[str]] = None
         if capability_type:
-            results = [c for c in results if c.capability_type == capability_type]
-        
+            ids = self._by_type.get(capability_type, set())
         if tags:
-            results = [c for c in results if tags & c.tags]
+            tagged = set().union(*(self._by_tag.get(tag, ()) for tag in tags))
+            ids = tagged if ids is None else ids & tagged
         
-        if healthy_only:
-            results = [c for c in results if c.is_healthy]
+        if ids is None:
+            results = list(self._capabilities.values())
+        else:
+            # Registration order, sorting only the matched ids
+            capabilities = self._capabilities
+            results = [capabilities[cap_id] for cap_id in sorted(ids, key=self._seq.__getitem__)]
         
+        # One pass, specialized to the filters actually in use
+        if name:
+            needle = name.lower()
+            if healthy_only:
+                return [c for c in results if c.is_healthy and needle in c.name.lower()]
+            return [c for c in results if needle in c.name.lower()]
+        if healthy_only:
+            return [c for c in results if c.is_healthy]
         return results
     
+    def healthy_capabilities(self) -> List[Capability]:
+        """Healthy capabilities, cached until a registration or health change"""
+        if self._healthy is None:
+            self._healthy = [c for c in self._capabilities.values() if c.is_healthy]
+        return self._healthy
+    
     def stats(self) -> Dict:
         """Get discovery statistics"""
         return {
             "total_sources": len(self._sources),
             "active_sources": len([s for s in self._sources.values() if s.is_active]),
             "total_capabilities": len(self._capabilities),
-            "healthy_capabilities": len([c for c in self._capabilities.values() if c.is_healthy]),
+            "healthy_capabilities": self._healthy_count,
+            "probe_failures": self.probe_failures,
             "by_type": {
-                t.value: len([c for c in self._capabilities.values() if c.capability_type == t])
+                t.value: len(self._by_type.get(t, ()))
                 for t in CapabilityType
             },
         }
 
 
+def make_http_client(pool_size: int = 200):
+    """
+    Shared discovery client, or None without httpx.
+    
+    Discovery fans out across sources and probe paths at once, so the pool
+    is sized well above httpx's default; HTTP/2 multiplexes requests to the
+    same host when h2 is installed.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    
+    # Pool and protocol settings live on the transport when one is given
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=max(1, pool_size // 2),
+            keepalive_expiry=60.0,
+        ),
+        retries=1,
+    )
+    return httpx.AsyncClient(timeout=10.0, transport=transport)
+
+
 # Global discovery engine
 _engine: Optional[DiscoveryEngine] = None
 
@@ -613,11 +958,8 @@ def get_discovery_engine() -> DiscoveryEngine:
     """Get or create global discovery engine"""
     global _engine
     if _engine is None:
-        try:
-            import httpx
-            client = httpx.AsyncClient(timeout=10.0)
-        except ImportError:
-            client = None
+        client = make_http_client()
+        if client is None:
             logger.warning("httpx not installed, HTTP discovery disabled")
             
         _engine = DiscoveryEngine(http_client=client)
@@ -5,16 +5,62 @@ Self-modifying memory patterns that enable learning and adaptation.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 from enum import Enum
+import math
+import operator
 import time
 import logging
 import hashlib
 import json
+import re
+
+# Optional HNSW index for semantic recall; without it recall always uses the
+# flat cosine scan in _semantic_sort
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Optional NumPy for the flat similarity scan: embeddings are also kept as a
+# row-normalized float32 matrix so a scan is one matrix-vector product
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .quantization import CoarseQuantizer, PQCodec
+from .query_cache import QueryCache
 
 logger = logging.getLogger(__name__)
 
 
+_MISSING = object()
+
+
+def _unit(vector: List[float]) -> List[float]:
+    """L2-normalized copy of a vector; zero vectors are returned as-is"""
+    norm = math.hypot(*vector)
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+def _stored_embedding(vector: Sequence[float]) -> Optional[Union[List[float], "np.ndarray"]]:
+    """Unit-length embedding in its stored form; None when empty"""
+    if not len(vector):
+        return None
+    if not NUMPY_AVAILABLE:
+        return _unit(vector)
+    array = np.array(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    if norm:
+        array /= norm
+    return array
+
+
 class MemtoolType(Enum):
     """Types of memory tools"""
     STORE = "store"           # Store data persistently
@@ -27,7 +73,7 @@ class MemtoolType(Enum):
     INDEX = "index"           # Create searchable indices
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
     """A single memory unit"""
     memory_id: str
@@ -47,8 +93,9 @@ class Memory:
     links: Set[str] = field(default_factory=set)
     tags: Set[str] = field(default_factory=set)
     
-    # Embeddings for vector search
-    embedding: Optional[List[float]] = None
+    # Embeddings for vector search, stored L2-normalized; a contiguous
+    # float32 array when NumPy is installed, else a list
+    embedding: Optional[Union[List[float], "np.ndarray"]] = None
     
     def access(self):
         """Record an access, boosting importance"""
@@ -74,7 +121,11 @@ class Memory:
             "decay_rate": self.decay_rate,
             "links": list(self.links),
             "tags": list(self.tags),
-            "embedding": self.embedding,
+            "embedding": (
+                self.embedding.tolist()
+                if self.embedding is not None and not isinstance(self.embedding, list)
+                else self.embedding
+            ),
         }
     
     @classmethod
@@ -91,7 +142,9 @@ class Memory:
         )
         mem.links = set(data.get("links", []))
         mem.tags = set(data.get("tags", []))
-        mem.embedding = data.get("embedding")
+        # Renormalizes vectors persisted before embeddings were normalized
+        embedding = data.get("embedding")
+        mem.embedding = _stored_embedding(embedding) if embedding else None
         return mem
 
 
@@ -112,6 +165,29 @@ class Pattern:
     
     # Associated memories
     memory_ids: Set[str] = field(default_factory=set)
+    
+    def __post_init__(self):
+        # Split the trigger once so matching never re-walks or recompiles it;
+        # plain attributes rather than fields keep them out of asdict()
+        self._equals: Tuple[Tuple[str, Any], ...] = tuple(
+            (key, expected) for key, expected in self.trigger_conditions.items()
+            if not (isinstance(expected, dict) and "$regex" in expected)
+        )
+        self._regexes: Tuple[Tuple[str, "re.Pattern"], ...] = tuple(
+            (key, re.compile(expected["$regex"]))
+            for key, expected in self.trigger_conditions.items()
+            if isinstance(expected, dict) and "$regex" in expected
+        )
+    
+    def matches(self, context: Dict[str, Any]) -> bool:
+        """Check if the trigger conditions hold in context"""
+        for key, expected in self._equals:
+            if context.get(key, _MISSING) != expected:
+                return False
+        for key, regex in self._regexes:
+            if key not in context or not regex.match(str(context[key])):
+                return False
+        return True
 
 
 class MemtoolRegistry:
@@ -119,7 +195,28 @@ class MemtoolRegistry:
     Registry for memory tools.
     
     Provides operations for storing, recalling, and manipulating memories.
+
+    When hnswlib is installed, embeddings are also added to an HNSW index.
+    Unfiltered semantic recall queries the index once it holds every memory
+    and at least ANN_MIN_MEMORIES of them; smaller or tag/type-filtered
+    candidate sets are scanned directly, vectorized with NumPy when installed.
+    Once PQ_TRAIN_MEMORIES embeddings are stored the scan matrix is split
+    into ~sqrt(N) k-means partitions and product quantized to PQ_SUBSPACES
+    bytes per memory. Unfiltered scans then only visit the IVF_PROBES nearest
+    partitions, rank by the approximate scores and rerank the best candidates
+    exactly.
     """
+
+    ANN_MIN_MEMORIES = 256
+    ANN_INITIAL_CAPACITY = 1024
+    ANN_EF_SEARCH = 64
+    EMB_INITIAL_CAPACITY = 256
+    PQ_TRAIN_MEMORIES = 10000
+    PQ_SUBSPACES = 16
+    PQ_RERANK_FACTOR = 10
+    IVF_PROBES = 8
+    EMBED_CACHE_SIZE = 1024
+    ID_CACHE_SIZE = 4096
     
     def __init__(self, storage=None, embedder=None):
         self._memories: Dict[str, Memory] = {}
@@ -127,9 +224,47 @@ class MemtoolRegistry:
         self._indices: Dict[str, Dict[str, Set[str]]] = {}
         self._storage = storage  # Cloudflare R2/D1 adapter
         self._embedder = embedder  # Text embedding function
+        # Embeddings by text digest; repeated queries skip the embedder
+        self._embed_cache = QueryCache(max_size=self.EMBED_CACHE_SIZE, ttl_seconds=math.inf)
+        # Memory ids of recently stored string content
+        self._id_cache = QueryCache(max_size=self.ID_CACHE_SIZE, ttl_seconds=math.inf)
+
+        # Bumped whenever memories are added or removed, so cached recall
+        # results keyed on it go stale automatically
+        self.generation = 0
+
+        # HNSW index over embeddings (created on first embedded store)
+        self._ann = None
+        self._ann_labels: Dict[int, str] = {}  # label -> memory_id
+        self._ann_ids: Dict[str, int] = {}  # memory_id -> label
+        self._next_ann_label = 0
+
+        # Row-normalized embedding matrix for the flat scan (NumPy only);
+        # replaced by PQ codes once PQ_TRAIN_MEMORIES embeddings are stored
+        self._emb_dim: Optional[int] = None
+        self._emb_matrix = None
+        self._emb_codes = None
+        self._pq: Optional[PQCodec] = None
+        # Inverted-file partition of each row, trained alongside the codec
+        self._ivf: Optional[CoarseQuantizer] = None
+        self._emb_partitions = None
+        self._emb_ids: List[str] = []  # row -> memory_id
+        self._emb_rows: Dict[str, int] = {}  # memory_id -> row
     
     def _generate_id(self, content: Any) -> str:
         """Generate content-based ID"""
+        # Strings are immutable, so their ids can be reused safely; other
+        # content may be mutated between stores and is always re-serialized
+        if type(content) is str:
+            memory_id = self._id_cache.get(content)
+            if memory_id is None:
+                memory_id = self._hash_id(content)
+                self._id_cache.put(content, memory_id)
+            return memory_id
+        return self._hash_id(content)
+    
+    @staticmethod
+    def _hash_id(content: Any) -> str:
         content_str = json.dumps(content, sort_keys=True, default=str)
         return f"mem_{hashlib.sha256(content_str.encode()).hexdigest()[:16]}"
     
@@ -138,12 +273,52 @@ class MemtoolRegistry:
         content: Any,
         memory_type: str = "general",
         importance: float = 0.5,
-        tags: Optional[Set[str]] = None,
+        tags: Optional[AbstractSet[str]] = None,
         links: Optional[Set[str]] = None,
         enforcement: Optional[Dict[str, Any]] = None,
     ) -> Memory:
         """Store a new memory"""
-        # Kernel-level enforcement (global guardrails)
+        await self._enforce_store(memory_type, enforcement)
+        return await self._insert(content, memory_type, importance, tags, links)
+    
+    async def store_many(
+        self,
+        items: Sequence[Dict[str, Any]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Store several memories, each given as `store()` keyword arguments.
+
+        Kernel enforcement runs once per distinct memory type among items
+        without an enforcement context. With `return_exceptions`, a failed
+        item yields its exception in place of a Memory, like asyncio.gather.
+        """
+        decisions: Dict[str, Optional[Exception]] = {}
+        results: List[Any] = []
+        for item in items:
+            item = dict(item)
+            memory_type = item.get("memory_type", "general")
+            enforcement = item.pop("enforcement", None)
+            try:
+                if enforcement:
+                    await self._enforce_store(memory_type, enforcement)
+                else:
+                    if memory_type not in decisions:
+                        try:
+                            await self._enforce_store(memory_type, None)
+                            decisions[memory_type] = None
+                        except PermissionError as e:
+                            decisions[memory_type] = e
+                    if decisions[memory_type] is not None:
+                        raise decisions[memory_type]
+                results.append(await self._insert(**item))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+    
+    async def _enforce_store(self, memory_type: str, enforcement: Optional[Dict[str, Any]]):
+        """Kernel-level enforcement (global guardrails); raises PermissionError"""
         try:
             from security.kernel import get_kernel_enforcer
 
@@ -159,7 +334,16 @@ class MemtoolRegistry:
             raise
         except Exception as e:
             raise PermissionError(f"Kernel enforcement error: {e}")
-
+    
+    async def _insert(
+        self,
+        content: Any,
+        memory_type: str = "general",
+        importance: float = 0.5,
+        tags: Optional[AbstractSet[str]] = None,
+        links: Optional[Set[str]] = None,
+    ) -> Memory:
+        """Add an already-authorized memory to the store and its indices"""
         memory_id = self._generate_id(content)
         
         # Check if exists
@@ -180,12 +364,15 @@ class MemtoolRegistry:
         # Generate embedding if embedder available
         if self._embedder:
             content_str = str(content) if not isinstance(content, str) else content
-            memory.embedding = await self._embedder(content_str)
+            memory.embedding = _stored_embedding(await self._embed(content_str))
         
         self._memories[memory_id] = memory
+        self.generation += 1
         
         # Update indices
         self._index_memory(memory)
+        self._ann_add(memory)
+        self._emb_add(memory)
         
         # Persist if storage available
         if self._storage:
@@ -198,11 +385,16 @@ class MemtoolRegistry:
         self,
         memory_id: Optional[str] = None,
         query: Optional[str] = None,
-        tags: Optional[Set[str]] = None,
+        tags: Optional[AbstractSet[str]] = None,
         memory_type: Optional[str] = None,
         limit: int = 10,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Memory]:
-        """Recall memories by ID, query, or filters"""
+        """Recall memories by ID, query, or filters.
+
+        Callers that already embedded `query` (see `embed`) can pass
+        `query_embedding` to skip embedding it again.
+        """
         
         # Direct recall by ID
         if memory_id:
@@ -212,28 +404,44 @@ class MemtoolRegistry:
                 return [memory]
             return []
         
-        # Filter by tags
-        if tags:
-            matching_ids = set()
-            for tag in tags:
-                if tag in self._indices.get("tags", {}):
-                    matching_ids.update(self._indices["tags"][tag])
-            
-            memories = [
-                self._memories[mid] for mid in matching_ids
-                if mid in self._memories
-            ]
-        else:
-            memories = list(self._memories.values())
+        # Unfiltered semantic recall goes through the ANN index when it is warm
+        if query and self._embedder and not tags and not memory_type and self._ann_ready():
+            if query_embedding is None:
+                query_embedding = await self._embed(query)
+            memories = self._ann_search(query_embedding, limit)
+            for memory in memories:
+                memory.access()
+            return memories
         
-        # Filter by type
+        # Filter by tags (any) and type with set algebra over the indices;
+        # postings may still hold forgotten ids, dropped on lookup
+        matching_ids: Optional[Set[str]] = None
+        if tags:
+            by_tag = self._indices.get("tags", {})
+            matching_ids = set().union(*(by_tag[tag] for tag in tags if tag in by_tag))
         if memory_type:
-            memories = [m for m in memories if m.memory_type == memory_type]
+            typed = self._indices.get("types", {}).get(memory_type, set())
+            matching_ids = typed if matching_ids is None else matching_ids & typed
+        
+        if matching_ids is None:
+            memories = list(self._memories.values())
+        else:
+            memories = [m for m in map(self._memories.get, matching_ids) if m is not None]
         
         # Semantic search if query provided
         if query and self._embedder:
-            query_embedding = await self._embedder(query)
-            memories = self._semantic_sort(memories, query_embedding)
+            if query_embedding is None:
+                query_embedding = await self._embed(query)
+            found = None
+            if len(memories) >= self.ANN_MIN_MEMORIES and self._ann_ready():
+                # Large filtered sets search the index restricted to them
+                found = self._ann_search(
+                    query_embedding, limit,
+                    matching_ids if matching_ids is not None else {m.memory_id for m in memories},
+                )
+            if found is None:
+                found = self._semantic_top(memories, query_embedding, limit)
+            memories = found
         else:
             # Sort by importance and recency
             memories.sort(
@@ -247,29 +455,283 @@ class MemtoolRegistry:
         
         return memories[:limit]
     
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embed text with the configured embedder, or None without one"""
+        if not self._embedder:
+            return None
+        return await self._embed(text)
+    
+    async def _embed(self, text: str) -> List[float]:
+        """Embed text through the LRU embedding cache"""
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        embedding = self._embed_cache.get(key)
+        if embedding is None:
+            embedding = await self._embedder(text)
+            self._embed_cache.put(key, embedding)
+        return embedding
+    
+    def _emb_add(self, memory: Memory):
+        """Append a memory's embedding to the scan matrix"""
+        if not NUMPY_AVAILABLE or memory.embedding is None:
+            return
+        
+        vector = np.asarray(memory.embedding, dtype=np.float32)
+        if self._emb_dim is None:
+            self._emb_dim = vector.shape[0]
+            self._emb_matrix = np.zeros(
+                (self.EMB_INITIAL_CAPACITY, self._emb_dim), dtype=np.float32
+            )
+        elif vector.shape[0] != self._emb_dim:
+            # Left out of the matrix, which keeps recall on the Python scan
+            return
+        
+        row = len(self._emb_ids)
+        store = self._emb_store()
+        if row == store.shape[0]:
+            store = self._grow(store)
+            if self._pq is None:
+                self._emb_matrix = store
+            else:
+                self._emb_codes = store
+            if self._ivf is not None:
+                self._emb_partitions = self._grow(self._emb_partitions)
+        
+        store[row] = vector if self._pq is None else self._pq.encode(vector)[0]
+        if self._ivf is not None:
+            self._emb_partitions[row] = self._ivf.assign(vector)[0]
+        self._emb_ids.append(memory.memory_id)
+        self._emb_rows[memory.memory_id] = row
+        
+        if self._ivf is None and row + 1 >= self.PQ_TRAIN_MEMORIES:
+            self._quantize()
+    
+    @staticmethod
+    def _grow(array):
+        """Double an array's row capacity"""
+        grown = np.zeros((array.shape[0] * 2,) + array.shape[1:], dtype=array.dtype)
+        grown[:array.shape[0]] = array
+        return grown
+    
+    def _emb_store(self):
+        """The active row storage: float32 vectors, or PQ codes once trained"""
+        return self._emb_matrix if self._pq is None else self._emb_codes
+    
+    def _quantize(self):
+        """
+        Partition the scan matrix into ~sqrt(N) inverted lists and, when the
+        dimension splits evenly, replace float32 rows with uint8 PQ codes
+        """
+        count = len(self._emb_ids)
+        vectors = self._emb_matrix[:count]
+        
+        ivf = CoarseQuantizer(int(math.sqrt(count)))
+        ivf.train(vectors)
+        partitions = np.zeros(self._emb_matrix.shape[0], dtype=np.int32)
+        partitions[:count] = ivf.assign(vectors)
+        self._ivf = ivf
+        self._emb_partitions = partitions
+        
+        if self._emb_dim % self.PQ_SUBSPACES:
+            return
+        codec = PQCodec(self._emb_dim, subspaces=self.PQ_SUBSPACES)
+        codec.train(vectors)
+        
+        codes = np.zeros((self._emb_matrix.shape[0], codec.subspaces), dtype=np.uint8)
+        codes[:count] = codec.encode(vectors)
+        self._pq = codec
+        self._emb_codes = codes
+        self._emb_matrix = None
+        logger.info(f"Quantized {count} embeddings into {codec.subspaces}-byte codes")
+    
+    def _emb_remove(self, memory_id: str):
+        """Drop a row from the scan matrix by moving the last row into it"""
+        row = self._emb_rows.pop(memory_id, None)
+        if row is None:
+            return
+        last = len(self._emb_ids) - 1
+        if row != last:
+            moved = self._emb_ids[last]
+            store = self._emb_store()
+            store[row] = store[last]
+            if self._ivf is not None:
+                self._emb_partitions[row] = self._emb_partitions[last]
+            self._emb_ids[row] = moved
+            self._emb_rows[moved] = row
+        self._emb_ids.pop()
+    
+    def _ivf_rows(self, query, k: int):
+        """Matrix rows in the partitions nearest the query, or None to scan all"""
+        if self._ivf is None:
+            return None
+        probes = self._ivf.probe(query, self.IVF_PROBES)
+        live = self._emb_partitions[:len(self._emb_ids)]
+        rows = np.flatnonzero(np.isin(live, probes))
+        # Too few candidates to fill the result: fall back to the full scan
+        return rows if len(rows) >= k else None
+    
+    def _emb_scores(self, rows, query):
+        """Similarity of the given matrix rows to a unit query vector"""
+        if self._pq is None:
+            return self._emb_matrix[rows] @ query
+        return self._pq.score(self._emb_codes[rows], self._pq.lookup_table(query))
+    
+    def _pq_rerank(self, memories: List[Memory], scores, query, k: int):
+        """Exact scores for the best approximate candidates, -inf elsewhere"""
+        count = min(len(memories), k * self.PQ_RERANK_FACTOR)
+        if count < len(memories):
+            candidates = np.argpartition(-scores, count - 1)[:count]
+        else:
+            candidates = np.arange(len(memories))
+        
+        vectors = np.zeros((len(candidates), self._emb_dim), dtype=np.float32)
+        for i, index in enumerate(candidates):
+            embedding = memories[index].embedding
+            if embedding is not None:
+                vectors[i] = embedding
+        
+        exact = np.full(len(memories), -np.inf, dtype=np.float32)
+        exact[candidates] = vectors @ query
+        return exact
+    
+    def _semantic_top(
+        self,
+        memories: List[Memory],
+        query_embedding: List[float],
+        limit: int,
+    ) -> List[Memory]:
+        """Top `limit` memories by semantic similarity"""
+        if self._emb_dim is None or len(query_embedding) != self._emb_dim:
+            return self._semantic_sort(memories, query_embedding)[:limit]
+        
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        k = min(limit, len(memories))
+        if k <= 0 or not norm:
+            return memories[:max(k, 0)]
+        query /= norm
+        
+        if len(memories) == len(self._emb_ids) == len(self._memories):
+            # Unfiltered and fully embedded: scan the live rows directly,
+            # limited to the probed partitions once they exist
+            rows = self._ivf_rows(query, k)
+            if rows is None:
+                memories = [self._memories[mid] for mid in self._emb_ids]
+                scores = self._emb_scores(slice(0, len(self._emb_ids)), query)
+            else:
+                ids = self._emb_ids
+                memories = [self._memories[ids[row]] for row in rows]
+                scores = self._emb_scores(rows, query)
+        else:
+            rows = self._emb_rows
+            picked = [rows.get(m.memory_id, -1) for m in memories]
+            if any(row < 0 and m.embedding is not None for row, m in zip(picked, memories)):
+                # Embedded but not in the matrix (other dimension)
+                return self._semantic_sort(memories, query_embedding)[:limit]
+            # Memories without an embedding score 0, as in _semantic_sort
+            picked = np.asarray(picked, dtype=np.intp)
+            embedded = picked >= 0
+            scores = np.zeros(len(memories), dtype=np.float32)
+            scores[embedded] = self._emb_scores(picked[embedded], query)
+        
+        if self._pq is not None:
+            scores = self._pq_rerank(memories, scores, query, k)
+        
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        # Highest score first; ties keep candidate order like the stable sort
+        top = top[np.lexsort((top, -scores[top]))]
+        return [memories[i] for i in top]
+    
     def _semantic_sort(
         self,
         memories: List[Memory],
         query_embedding: List[float],
     ) -> List[Memory]:
-        """Sort memories by semantic similarity"""
-        def cosine_similarity(a: List[float], b: List[float]) -> float:
-            if not a or not b:
-                return 0.0
-            dot = sum(x * y for x, y in zip(a, b))
-            norm_a = sum(x * x for x in a) ** 0.5
-            norm_b = sum(x * x for x in b) ** 0.5
-            if norm_a == 0 or norm_b == 0:
-                return 0.0
-            return dot / (norm_a * norm_b)
-        
-        scored = [
-            (m, cosine_similarity(m.embedding or [], query_embedding))
-            for m in memories
-        ]
-        scored.sort(key=lambda x: x[1], reverse=True)
+        """
+        Sort memories by semantic similarity.
+        
+        Pure-Python fallback for when the NumPy matrix cannot serve the scan.
+        Stored embeddings are unit vectors, so cosine similarity is a dot
+        product with the normalized query.
+        """
+        query = _unit(query_embedding)
+        
+        def similarity(a) -> float:
+            return float(sum(map(operator.mul, a, query))) if a is not None else 0.0
+        
+        scored = [(m, similarity(m.embedding)) for m in memories]
+        scored.sort(key=operator.itemgetter(1), reverse=True)
         return [m for m, _ in scored]
     
+    def _ann_add(self, memory: Memory):
+        """Add a memory's embedding to the HNSW index"""
+        if not HNSWLIB_AVAILABLE or memory.embedding is None:
+            return
+        
+        if self._ann is None:
+            self._ann = hnswlib.Index(space="cosine", dim=len(memory.embedding))
+            self._ann.init_index(
+                max_elements=self.ANN_INITIAL_CAPACITY, M=16, ef_construction=200
+            )
+        elif len(memory.embedding) != self._ann.dim:
+            # Left out of the index, which keeps recall on the flat scan
+            return
+        
+        if self._ann.element_count >= self._ann.max_elements:
+            self._ann.resize_index(self._ann.max_elements * 2)
+        
+        label = self._next_ann_label
+        self._next_ann_label += 1
+        self._ann.add_items([memory.embedding], [label])
+        self._ann_labels[label] = memory.memory_id
+        self._ann_ids[memory.memory_id] = label
+    
+    def _ann_remove(self, memory_id: str):
+        """Drop a forgotten memory from the HNSW index"""
+        label = self._ann_ids.pop(memory_id, None)
+        if label is not None:
+            self._ann.mark_deleted(label)
+            del self._ann_labels[label]
+    
+    def _ann_ready(self) -> bool:
+        """Whether the HNSW index can answer for the whole store"""
+        indexed = len(self._ann_ids)
+        return (
+            self._ann is not None
+            and indexed >= self.ANN_MIN_MEMORIES
+            and indexed == len(self._memories)
+        )
+    
+    def _ann_search(
+        self,
+        query_embedding: List[float],
+        limit: int,
+        allowed: Optional[AbstractSet[str]] = None,
+    ) -> Optional[List[Memory]]:
+        """
+        Nearest memories to the query embedding, most similar first.
+        
+        With `allowed`, only those memory ids are considered; returns None
+        if the filtered search cannot find enough neighbours.
+        """
+        k = min(limit, len(self._ann_ids) if allowed is None else len(allowed))
+        if k <= 0:
+            return []
+        self._ann.set_ef(max(self.ANN_EF_SEARCH, k))
+        if allowed is None:
+            labels, _ = self._ann.knn_query([query_embedding], k=k)
+        else:
+            names = self._ann_labels
+            try:
+                labels, _ = self._ann.knn_query(
+                    [query_embedding], k=k, filter=lambda label: names[label] in allowed
+                )
+            except RuntimeError:
+                return None
+        return [self._memories[self._ann_labels[int(label)]] for label in labels[0]]
+    
     def _index_memory(self, memory: Memory):
         """Add memory to indices"""
         # Index by tags
@@ -314,6 +776,8 @@ class MemtoolRegistry:
         if memory_id:
             if memory_id in self._memories:
                 del self._memories[memory_id]
+                self._ann_remove(memory_id)
+                self._emb_remove(memory_id)
                 forgotten = 1
         elif below_importance is not None:
             to_forget = [
@@ -322,8 +786,13 @@ class MemtoolRegistry:
             ]
             for mid in to_forget:
                 del self._memories[mid]
+                self._ann_remove(mid)
+                self._emb_remove(mid)
             forgotten = len(to_forget)
         
+        if forgotten:
+            self.generation += 1
+        
         logger.debug(f"Forgotten {forgotten} memories")
         return forgotten
     
@@ -382,6 +851,28 @@ class MemtoolRegistry:
         logger.debug(f"Recognized pattern: {pattern_id}")
         return pattern
     
+    async def store_with_pattern(
+        self,
+        content: Any,
+        pattern_type: str,
+        trigger_conditions: Dict[str, Any],
+        response_template: Optional[str] = None,
+        memory_type: str = "general",
+        importance: float = 0.5,
+        tags: Optional[AbstractSet[str]] = None,
+        enforcement: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Pattern, Memory]:
+        """Register a pattern and store the memory it was learned from.
+
+        Enforcement runs before either write, so a denied store leaves no
+        pattern behind; the memory is linked to the pattern.
+        """
+        await self._enforce_store(memory_type, enforcement)
+        pattern = await self.recognize_pattern(pattern_type, trigger_conditions, response_template)
+        memory = await self._insert(content, memory_type, importance, tags)
+        pattern.memory_ids.add(memory.memory_id)
+        return pattern, memory
+    
     async def match_patterns(self, context: Dict[str, Any]) -> List[Pattern]:
         """Find patterns matching the current context"""
         matches = []
@@ -396,17 +887,7 @@ class MemtoolRegistry:
     
     def _pattern_matches(self, pattern: Pattern, context: Dict[str, Any]) -> bool:
         """Check if pattern matches context"""
-        for key, expected in pattern.trigger_conditions.items():
-            if key not in context:
-                return False
-            actual = context[key]
-            if isinstance(expected, dict) and "$regex" in expected:
-                import re
-                if not re.match(expected["$regex"], str(actual)):
-                    return False
-            elif actual != expected:
-                return False
-        return True
+        return pattern.matches(context)
     
     async def apply_decay(self, time_delta: float = 1.0):
         """Apply decay to all memories"""
@@ -462,6 +943,7 @@ class MemtoolRegistry:
                 sum(m.importance for m in self._memories.values()) / len(self._memories)
                 if self._memories else 0.0
             ),
+            "embedding_cache": self._embed_cache.stats(),
         }
 
 
@@ -5,10 +5,12 @@ The AGI doesn't USE the network - the AGI IS the network.
 Intelligence emerges from the collective behavior of reactive slots.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Callable, Awaitable
+from typing import Any, Deque, Dict, List, Optional, Set, Callable, Awaitable, Tuple
 import hashlib
+import itertools
 import time
 import asyncio
 import logging
@@ -18,6 +20,16 @@ from .operators import OperatorSignature, OperatorRegistry, get_operator_registr
 
 logger = logging.getLogger(__name__)
 
+# Signal ids: a random per-process prefix plus a counter, unique without
+# clock reads (pids repeat across container restarts, so not the pid)
+_SIGNAL_ID_PREFIX = f"sig_{uuid.uuid4().hex[:8]}_"
+_signal_counter = itertools.count()
+
+
+def new_signal_id() -> str:
+    """Return a process-unique signal id"""
+    return _SIGNAL_ID_PREFIX + str(next(_signal_counter))
+
 
 class SlotState(Enum):
     """State of a reactive slot"""
@@ -41,7 +53,7 @@ class SignalType(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """A signal passed between slots"""
     signal_id: str
@@ -79,7 +91,7 @@ class ReactiveSlot:
     connections: Set[str] = field(default_factory=set)
     
     # Signal queue
-    signal_queue: List[Signal] = field(default_factory=list)
+    signal_queue: Deque[Signal] = field(default_factory=deque)
     
     # Reactive bindings
     bindings: List["ReactiveBinding"] = field(default_factory=list)
@@ -169,6 +181,11 @@ class EmergentNetwork:
     def __init__(self, registry: Optional[OperatorRegistry] = None):
         self.registry = registry or get_operator_registry()
         self.slots: Dict[str, ReactiveSlot] = {}
+        # Ids of slots with queued signals (dict as an ordered set), so the
+        # signal loop never scans idle slots
+        self._pending: Dict[str, None] = {}
+        # Set whenever a pending slot may have become processable
+        self._signals_ready = asyncio.Event()
         self._running = False
         self._tasks: List[asyncio.Task] = []
         self._signal_handlers: Dict[str, List[Callable]] = {}
@@ -265,27 +282,54 @@ class EmergentNetwork:
     
     async def send_signal(self, signal: Signal):
         """Send a signal into the network"""
+        self._enqueue_signal(signal)
+    
+    async def send_signals(self, signals: List[Signal]) -> List[str]:
+        """Send a batch of signals into the network, returning their ids"""
+        enqueue = self._enqueue_signal
+        for signal in signals:
+            enqueue(signal)
+        return [signal.signal_id for signal in signals]
+    
+    def _enqueue_signal(self, signal: Signal):
+        """Queue a signal on its target slot, or on the source's connections"""
         # Add to target slot's queue
         if signal.target_slot:
             if signal.target_slot in self.slots:
                 self.slots[signal.target_slot].signal_queue.append(signal)
+                self._pending[signal.target_slot] = None
+                self._signals_ready.set()
         else:
             # Broadcast to connected slots from source
-            if signal.source_slot in self.slots:
-                source = self.slots[signal.source_slot]
-                for conn_id in source.connections:
-                    if conn_id in self.slots:
-                        # Clone signal for each target
-                        sig_copy = Signal(
-                            signal_id=signal.signal_id,
-                            signal_type=signal.signal_type,
-                            source_slot=signal.source_slot,
-                            target_slot=conn_id,
-                            payload=signal.payload.copy(),
-                            ttl=signal.ttl - 1,
-                            path=signal.path + [signal.source_slot],
-                        )
-                        self.slots[conn_id].signal_queue.append(sig_copy)
+            slots = self.slots
+            source = slots.get(signal.source_slot)
+            if source is None:
+                return
+            # Fields common to every copy are built once; paths are never
+            # mutated in place, so the copies share one list
+            ttl = signal.ttl - 1
+            path = signal.path + [signal.source_slot]
+            payload = signal.payload
+            pending = self._pending
+            for conn_id in source.connections:
+                target = slots.get(conn_id)
+                if target is None:
+                    continue
+                # Clone signal for each target; payloads stay per-copy
+                # since transforms may mutate them
+                target.signal_queue.append(Signal(
+                    signal.signal_id,
+                    signal.signal_type,
+                    signal.source_slot,
+                    conn_id,
+                    payload.copy(),
+                    signal.timestamp,
+                    ttl,
+                    path,
+                ))
+                pending[conn_id] = None
+            if source.connections:
+                self._signals_ready.set()
     
     async def invoke_operator(
         self,
@@ -310,6 +354,8 @@ class EmergentNetwork:
         try:
             result = await self.registry.invoke(operator_id, inputs)
             slot.state = SlotState.LISTENING
+            if slot.signal_queue:
+                self._signals_ready.set()
             return {
                 "success": result.success,
                 "outputs": result.outputs,
@@ -322,15 +368,30 @@ class EmergentNetwork:
             return {"success": False, "error": str(e)}
     
     async def _signal_loop(self):
-        """Process signals for all slots"""
+        """Process queued signals whenever any are enqueued"""
         while self._running:
             try:
-                for slot in list(self.slots.values()):
-                    if slot.signal_queue and slot.state in (SlotState.LISTENING, SlotState.IDLE):
-                        signal = slot.signal_queue.pop(0)
-                        await self._process_signal(slot, signal)
+                await self._signals_ready.wait()
+                # Cleared before draining, so signals queued meanwhile
+                # trigger another pass
+                self._signals_ready.clear()
+                pending = self._pending
+                for slot_id in list(pending):
+                    slot = self.slots.get(slot_id)
+                    if slot is None:
+                        pending.pop(slot_id, None)
+                        continue
+                    # Drain while the slot stays ready; a failed signal
+                    # leaves it in ERROR with the rest still queued
+                    queue = slot.signal_queue
+                    while queue and slot.state in (SlotState.LISTENING, SlotState.IDLE):
+                        await self._process_signal(slot, queue.popleft())
+                    if not queue:
+                        pending.pop(slot_id, None)
                 
-                await asyncio.sleep(0.01)  # 10ms tick
+                # Yield between passes so forwarding cycles cannot starve
+                # the event loop
+                await asyncio.sleep(0)
             except Exception as e:
                 logger.error(f"Signal loop error: {e}")
     
@@ -396,6 +457,8 @@ class EmergentNetwork:
                         if now - slot.last_activity > 60:  # 1 minute timeout
                             slot.state = SlotState.LISTENING
                             slot.error_count = 0
+                            if slot.signal_queue:
+                                self._signals_ready.set()
                     
                     # Mark inactive slots
                     if now - slot.last_activity > 300:  # 5 minute timeout
@@ -406,6 +469,10 @@ class EmergentNetwork:
             except Exception as e:
                 logger.error(f"Health loop error: {e}")
     
+    def snapshot(self) -> Tuple[int, bool]:
+        """Cheap liveness view: (slot count, running)"""
+        return len(self.slots), self._running
+    
     def get_state(self) -> Dict[str, Any]:
         """Get current network state"""
         states = {}
@@ -7,10 +7,11 @@ If REQUEST(X) → RESPONSE(Y) consistently, then OP(X) = Y
 This is the foundation of emergent AGI - discovering operators from the wild internet.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Callable, Awaitable
 import hashlib
+import json
 import time
 import asyncio
 import aiohttp
@@ -28,6 +29,42 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def json_default(obj: Any) -> Any:
+    """Encode in-process objects JSON lacks (dataclasses, sets, enums, arrays)
+
+    Shared by operator request bodies and API responses.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if hasattr(obj, "tolist"):
+        # NumPy arrays, e.g. memory embeddings
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> str:
+    """JSON encoder for operator request bodies"""
+    return json.dumps(obj, default=json_default)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain_json(obj: Any) -> bool:
+    """True if obj is already made only of JSON types"""
+    if isinstance(obj, _JSON_SCALARS):
+        return True
+    if isinstance(obj, dict):
+        return all(isinstance(k, str) and _is_plain_json(v) for k, v in obj.items())
+    if isinstance(obj, list):
+        return all(map(_is_plain_json, obj))
+    return False
+
+
 class OperatorType(Enum):
     """Fundamental logical operators discovered from API behaviors"""
     
@@ -233,6 +270,20 @@ class OperatorRegistry:
             self._save_to_disk()
             logger.info(f"Registered operator: {operator.operator_id} ({operator.operator_type.value})")
     
+    async def register_many(self, operators: List[OperatorSignature]):
+        """Register several operators under one lock with a single save"""
+        if not operators:
+            return
+        async with self._lock:
+            for operator in operators:
+                self._operators[operator.operator_id] = operator
+                ids = self._by_type.setdefault(operator.operator_type, [])
+                if operator.operator_id not in ids:
+                    ids.append(operator.operator_id)
+            
+            self._save_to_disk()
+            logger.info(f"Registered {len(operators)} operators")
+    
     async def get(self, operator_id: str) -> Optional[OperatorSignature]:
         """Get an operator by ID"""
         return self._operators.get(operator_id)
@@ -308,6 +359,9 @@ class OperatorRegistry:
                     invocation.error = "MCP client not available"
                     return invocation
                 
+                # Only bodies carrying in-process objects need converting
+                if not _is_plain_json(request_body):
+                    request_body = json.loads(_json_dumps(request_body))
                 try:
                     result = await self._invoke_mcp(operator, request_body, timeout)
                     invocation.latency_ms = (time.time() - start_time) * 1000
@@ -318,7 +372,7 @@ class OperatorRegistry:
                     invocation.success = False
                     invocation.error = str(e)
             else:
-                async with aiohttp.ClientSession() as session:
+                async with aiohttp.ClientSession(json_serialize=_json_dumps) as session:
                     if operator.method.upper() == "GET":
                         async with session.get(
                             operator.endpoint_url,
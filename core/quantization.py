@@ -0,0 +1,145 @@
+"""
+Quantization - Product quantization and inverted-file partitioning
+
+PQCodec splits vectors into equal subvectors, each replaced by the index of
+its nearest centroid in a per-subspace codebook (k-means). Inner products
+against a query are then a table lookup per subspace instead of a full dot
+product. CoarseQuantizer assigns whole vectors to k-means partitions so a
+query only needs to scan the few partitions nearest to it.
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def nearest_centers(points: "np.ndarray", centers: "np.ndarray") -> "np.ndarray":
+    """Index of the nearest center (squared L2) for each point"""
+    distances = (
+        (centers * centers).sum(axis=1)[None, :]
+        - 2.0 * points @ centers.T
+    )
+    return distances.argmin(axis=1)
+
+
+def kmeans(points: "np.ndarray", k: int, iterations: int = 8, seed: int = 0) -> "np.ndarray":
+    """Lloyd's k-means from a random sample of points; returns [k, dim] centers"""
+    n = points.shape[0]
+    rng = np.random.default_rng(seed)
+    centers = points[rng.choice(n, k, replace=False)].copy()
+    for _ in range(iterations):
+        assign = nearest_centers(points, centers)
+        counts = np.bincount(assign, minlength=k)
+        sums = np.stack([
+            np.bincount(assign, weights=points[:, j], minlength=k)
+            for j in range(points.shape[1])
+        ], axis=1)
+        filled = counts > 0
+        centers[filled] = sums[filled] / counts[filled, None]
+    return centers
+
+
+class PQCodec:
+    """
+    Product quantizer with `subspaces` codebooks of up to `centroids` entries.
+
+    With 256 centroids every code fits in a uint8, so a `dim`-dimensional
+    float32 vector shrinks from 4 * dim bytes to `subspaces` bytes. Scores are
+    approximate inner products; callers rerank the best candidates exactly.
+    """
+
+    def __init__(self, dim: int, subspaces: int = 8, centroids: int = 256):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("PQCodec requires numpy")
+        if dim % subspaces:
+            raise ValueError(f"dim {dim} is not divisible by {subspaces} subspaces")
+        if not 0 < centroids <= 256:
+            raise ValueError("centroids must be between 1 and 256")
+        self.dim = dim
+        self.subspaces = subspaces
+        self.centroids = centroids
+        self.sub_dim = dim // subspaces
+        # [subspaces, centroids, sub_dim]
+        self.codebooks: Optional["np.ndarray"] = None
+
+    @property
+    def trained(self) -> bool:
+        return self.codebooks is not None
+
+    def _split(self, vectors: "np.ndarray") -> "np.ndarray":
+        """[n, dim] -> [subspaces, n, sub_dim]"""
+        n = vectors.shape[0]
+        return vectors.reshape(n, self.subspaces, self.sub_dim).transpose(1, 0, 2)
+
+    def train(self, vectors: "np.ndarray", iterations: int = 8, seed: int = 0):
+        """Fit the codebooks with k-means on a sample of vectors"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        k = min(self.centroids, vectors.shape[0])
+        codebooks = np.zeros((self.subspaces, self.centroids, self.sub_dim), dtype=np.float32)
+
+        for m, points in enumerate(self._split(vectors)):
+            centers = kmeans(points, k, iterations, seed + m)
+            codebooks[m, :k] = centers
+            # Unused slots repeat a real centroid so they are never nearer
+            codebooks[m, k:] = centers[0]
+
+        self.codebooks = codebooks
+
+    def encode(self, vectors: "np.ndarray") -> "np.ndarray":
+        """Quantize [n, dim] vectors to [n, subspaces] uint8 codes"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        codes = np.empty((vectors.shape[0], self.subspaces), dtype=np.uint8)
+        for m, points in enumerate(self._split(vectors)):
+            codes[:, m] = nearest_centers(points, self.codebooks[m])
+        return codes
+
+    def lookup_table(self, query: "np.ndarray") -> "np.ndarray":
+        """Per-subspace inner products of the query with every centroid"""
+        query = np.asarray(query, dtype=np.float32).reshape(self.subspaces, self.sub_dim)
+        return np.einsum("mkd,md->mk", self.codebooks, query)
+
+    def score(self, codes: "np.ndarray", table: "np.ndarray") -> "np.ndarray":
+        """Approximate inner products of encoded vectors with the query"""
+        return table[np.arange(self.subspaces), codes].sum(axis=1)
+
+
+class CoarseQuantizer:
+    """
+    Inverted-file partitioning over k-means centroids.
+
+    Every vector belongs to its nearest centroid's partition; a query probes
+    only the partitions whose centroids are nearest to it.
+    """
+
+    def __init__(self, partitions: int):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("CoarseQuantizer requires numpy")
+        self.partitions = max(1, partitions)
+        # [partitions, dim]
+        self.centroids: Optional["np.ndarray"] = None
+
+    def train(self, vectors: "np.ndarray", iterations: int = 8, seed: int = 0):
+        """Fit the partition centroids with k-means"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self.partitions = min(self.partitions, vectors.shape[0])
+        self.centroids = kmeans(vectors, self.partitions, iterations, seed)
+
+    def assign(self, vectors: "np.ndarray") -> "np.ndarray":
+        """Partition id of each [n, dim] vector"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.centroids.shape[1])
+        return nearest_centers(vectors, self.centroids).astype(np.int32)
+
+    def probe(self, query: "np.ndarray", count: int) -> "np.ndarray":
+        """Ids of the `count` partitions nearest to the query"""
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        distances = (
+            (self.centroids * self.centroids).sum(axis=1)
+            - 2.0 * (self.centroids @ query)
+        )
+        if count >= self.partitions:
+            return np.arange(self.partitions, dtype=np.int32)
+        return np.argpartition(distances, count - 1)[:count].astype(np.int32)
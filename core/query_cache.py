@@ -0,0 +1,229 @@
+"""
+Query Cache - Bounded LRU cache with TTL expiry for repeated read queries
+
+Used in front of read endpoints whose results only change on writes.
+SemanticQueryCache additionally serves near-duplicate natural-language
+queries by embedding similarity.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with per-entry TTL.
+
+    Keys are built by callers from canonicalized query parameters and must be
+    hashable. Expired entries are dropped lazily on lookup; the least recently
+    used entry is evicted once `max_size` is exceeded.
+    """
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at on the monotonic clock, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if absent/expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any):
+        """Cache value under key"""
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_all(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class SemanticQueryCache:
+    """
+    Similarity-aware cache for natural-language queries.
+
+    Query embeddings are grouped into regions around running centroids
+    (online k-means, at most `max_regions`). A lookup hits when a cached query
+    with the same scope in the nearest region lies within that region's cosine
+    distance threshold.
+
+    Thresholds are learned from misses, where the real result is known: if the
+    fresh result equals the nearest cached one, the region's threshold loosens
+    toward that distance; if it differs, the threshold tightens below it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_regions: int = 32,
+        region_radius: float = 0.3,
+        initial_threshold: float = 0.05,
+        max_threshold: float = 0.2,
+        learning_rate: float = 0.25,
+        ttl_seconds: float = 300.0,
+    ):
+        self.max_entries = max_entries
+        self.max_regions = max_regions
+        self.region_radius = region_radius
+        self.initial_threshold = initial_threshold
+        self.max_threshold = max_threshold
+        self.learning_rate = learning_rate
+        self.ttl_seconds = ttl_seconds
+
+        # Parallel per-region state; centroids are unit vectors
+        self._centroids: List[List[float]] = []
+        self._counts: List[int] = []
+        self._thresholds: List[float] = []
+        # region -> [(expires_at, scope, unit_vector, value)]
+        self._regions: List[List[Tuple[float, Hashable, List[float], Any]]] = []
+        # (region, entry) in insertion order, for capacity eviction
+        self._order: Deque[Tuple[int, Tuple]] = deque()
+
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> Optional[List[float]]:
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0:
+            return None
+        return [x / norm for x in vector]
+
+    @staticmethod
+    def _distance(a: List[float], b: List[float]) -> float:
+        """Cosine distance between unit vectors"""
+        return 1.0 - sum(x * y for x, y in zip(a, b))
+
+    def _nearest_region(self, unit: List[float]) -> Tuple[Optional[int], float]:
+        best, best_distance = None, 2.0
+        for i, centroid in enumerate(self._centroids):
+            distance = self._distance(unit, centroid)
+            if distance < best_distance:
+                best, best_distance = i, distance
+        return best, best_distance
+
+    def _nearest_entry(
+        self, region: int, scope: Hashable, unit: List[float], now: float
+    ) -> Tuple[Optional[Tuple], float]:
+        best, best_distance = None, 2.0
+        for entry in self._regions[region]:
+            if entry[1] != scope or entry[0] <= now:
+                continue
+            distance = self._distance(unit, entry[2])
+            if distance < best_distance:
+                best, best_distance = entry, distance
+        return best, best_distance
+
+    def get(self, scope: Hashable, embedding: List[float], default: Any = None) -> Any:
+        """Return a cached value for a similar query in the same scope"""
+        unit = self._normalize(embedding) if embedding else None
+        now = time.monotonic()
+        with self._lock:
+            region = self._nearest_region(unit)[0] if unit else None
+            if region is not None:
+                entry, distance = self._nearest_entry(region, scope, unit, now)
+                if entry is not None and distance <= self._thresholds[region]:
+                    self.hits += 1
+                    return entry[3]
+            self.misses += 1
+            return default
+
+    def put(self, scope: Hashable, embedding: List[float], value: Any):
+        """Cache value for a query embedding, learning from the nearest entry"""
+        unit = self._normalize(embedding) if embedding else None
+        if unit is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            region, distance = self._nearest_region(unit)
+            if region is None or (
+                distance > self.region_radius and len(self._centroids) < self.max_regions
+            ):
+                region = len(self._centroids)
+                self._centroids.append(unit)
+                self._counts.append(1)
+                self._thresholds.append(self.initial_threshold)
+                self._regions.append([])
+            else:
+                self._learn(region, scope, unit, value, now)
+                self._move_centroid(region, unit)
+
+            entry = (now + self.ttl_seconds, scope, unit, value)
+            self._regions[region].append(entry)
+            self._order.append((region, entry))
+            while len(self._order) > self.max_entries:
+                old_region, old_entry = self._order.popleft()
+                self._regions[old_region].remove(old_entry)
+
+    def _learn(self, region: int, scope: Hashable, unit: List[float], value: Any, now: float):
+        """Adjust the region threshold from a miss whose result is now known"""
+        nearest, distance = self._nearest_entry(region, scope, unit, now)
+        if nearest is None:
+            return
+        threshold = self._thresholds[region]
+        if nearest[3] == value:
+            if distance > threshold:
+                threshold += self.learning_rate * (distance - threshold)
+        elif distance <= threshold:
+            threshold = distance * (1.0 - self.learning_rate)
+        self._thresholds[region] = min(threshold, self.max_threshold)
+
+    def _move_centroid(self, region: int, unit: List[float]):
+        """Running-mean update of a region centroid"""
+        self._counts[region] += 1
+        step = 1.0 / self._counts[region]
+        centroid = [c + (u - c) * step for c, u in zip(self._centroids[region], unit)]
+        self._centroids[region] = self._normalize(centroid) or centroid
+
+    def invalidate_all(self):
+        """Drop every cached entry and learned region"""
+        with self._lock:
+            self._centroids.clear()
+            self._counts.clear()
+            self._thresholds.clear()
+            self._regions.clear()
+            self._order.clear()
+
+    def stats(self) -> Dict:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._order),
+            "regions": len(self._centroids),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
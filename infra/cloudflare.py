@@ -367,25 +367,31 @@ class CloudflareEnv:
 # Worker Entry Point
 # ============================================================================
 
+_middleware_installed = False
+
+
 async def handle_request(request, env) -> dict:
     """
     Main Cloudflare Worker entry point.
     
     Converts Cloudflare request to internal Request and routes it.
     """
-    from ..api.routes import router, Request as InternalRequest, HttpMethod
+    from ..api.routes import router, Request as InternalRequest, encode_json
     from ..api.middleware import create_middleware_stack
     
     # Setup environment
     cf_env = CloudflareEnv.from_worker_env(env)
     
-    # Initialize middleware
-    for mw in create_middleware_stack():
-        router.use(mw)
+    # Initialize middleware once; the router is process-global
+    global _middleware_installed
+    if not _middleware_installed:
+        for mw in create_middleware_stack():
+            router.use(mw)
+        _middleware_installed = True
     
     # Convert to internal request
     internal_request = InternalRequest(
-        method=HttpMethod(request.method),
+        method=request.method.upper(),
         path=request.url.replace(request.origin, "").split("?")[0],
         headers=dict(request.headers),
         query=dict(request.query) if hasattr(request, "query") else {},
@@ -398,8 +404,8 @@ async def handle_request(request, env) -> dict:
     # Return Cloudflare response format
     return {
         "status": response.status,
-        "headers": response.headers,
-        "body": json.dumps(response.body) if response.body else "",
+        "headers": dict(response.headers),
+        "body": encode_json(response.body).decode() if response.body else "",
     }
 
 
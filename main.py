@@ -6,7 +6,7 @@ This is the main entry point for the Cloudflare Worker deployment.
 
 import json
 from .infra.cloudflare import CloudflareEnv, handle_request as cf_handle_request
-from .api.routes import router, Request as InternalRequest, Response, HttpMethod
+from .api.routes import router, Request as InternalRequest, Response, HttpMethod, encode_json
 from .api.middleware import create_middleware_stack
 
 
@@ -14,6 +14,22 @@ from .api.middleware import create_middleware_stack
 __version__ = "1.0.0"
 __name__ = "binetic-core"
 
+_middleware_installed = False
+
+
+def _install_middleware():
+    """Register the middleware stack on the global router once per process"""
+    global _middleware_installed
+    if _middleware_installed:
+        return
+    for mw in create_middleware_stack(
+        allowed_origins=["*"],  # Configure for production
+        requests_per_minute=60,
+        public_paths=["/api/health", "/api/auth/login"],
+    ):
+        router.use(mw)
+    _middleware_installed = True
+
 
 async def initialize(env=None):
     """
@@ -53,20 +69,13 @@ async def handle_request(request, env=None):
         cf_env = CloudflareEnv.local()
     
     # Initialize middleware
-    middleware_stack = create_middleware_stack(
-        allowed_origins=["*"],  # Configure for production
-        requests_per_minute=60,
-        public_paths=["/api/health", "/api/auth/login"],
-    )
-    
-    for mw in middleware_stack:
-        router.use(mw)
+    _install_middleware()
     
     # Parse request
     try:
         if hasattr(request, "method"):
             # Cloudflare request object
-            method = HttpMethod(request.method.upper())
+            method = request.method.upper()
             path = str(request.url).split("?")[0]
             if "://" in path:
                 path = "/" + path.split("/", 3)[-1] if path.count("/") > 2 else "/"
@@ -90,7 +99,7 @@ async def handle_request(request, env=None):
         else:
             # Dict-like request (testing)
             internal_request = InternalRequest(
-                method=HttpMethod(request.get("method", "GET").upper()),
+                method=request.get("method", "GET").upper(),
                 path=request.get("path", "/"),
                 headers=request.get("headers", {}),
                 query=request.get("query", {}),
@@ -118,7 +127,7 @@ async def handle_request(request, env=None):
             "X-Content-Type-Options": "nosniff",
             "Referrer-Policy": "no-referrer",
         },
-        "body": json.dumps(response.body) if response.body else "",
+        "body": encode_json(response.body).decode() if response.body else "",
     }
 
 
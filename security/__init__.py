@@ -33,6 +33,11 @@ from .policies import (
     get_policy_engine,
     DEFAULT_POLICIES,
 )
+from .audit import (
+    AuditEntry,
+    AuditLog,
+    get_audit_log,
+)
 from .sessions import (
     SessionManager,
     Session,
@@ -62,6 +67,10 @@ __all__ = [
     "Restriction",
     "get_policy_engine",
     "DEFAULT_POLICIES",
+    # Audit
+    "AuditEntry",
+    "AuditLog",
+    "get_audit_log",
     # Sessions
     "SessionManager",
     "Session",
@@ -0,0 +1,165 @@
+"""
+Audit Log - Access decisions recorded off the request path
+
+Handlers enqueue entries without blocking; a daemon writer thread drains the
+queue in batches to an append-only JSONL file. For Cloudflare deployment D1
+is the durable store, the local file guards against loss in between.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AuditEntry:
+    """A single access decision"""
+    resource_type: str
+    resource_id: str
+    level: str
+    allowed: bool
+
+    # Caller
+    owner_id: Optional[str] = None
+    key_id: Optional[str] = None
+    policy_id: Optional[str] = None
+
+    # Request
+    method: Optional[str] = None
+    path: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class AuditLog:
+    """
+    Non-blocking audit log.
+
+    `record()` only enqueues; a background thread writes up to `batch_size`
+    entries per write call, so file IO never runs on the event loop. The most
+    recent `max_recent` entries are also kept in memory for the API. With no
+    `persist_path` entries are kept in memory only.
+    """
+
+    def __init__(
+        self,
+        persist_path: Optional[str] = "data/audit.jsonl",
+        batch_size: int = 32,
+        max_recent: int = 1000,
+        max_pending: int = 10000,
+    ):
+        self._persist_path = persist_path
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[AuditEntry]" = queue.Queue(maxsize=max_pending)
+        self._recent: Deque[AuditEntry] = deque(maxlen=max_recent)
+        self._writer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.dropped = 0
+
+    def record(self, entry: AuditEntry):
+        """Enqueue an entry; never blocks the caller"""
+        self._recent.append(entry)
+        if self._persist_path is None:
+            return
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+        if self._persist_path is None:
+            # The writer disabled persistence while this entry was queued
+            self._drain()
+
+    def recent(self, limit: int = 100) -> List[AuditEntry]:
+        """Most recent entries, newest first"""
+        entries = list(self._recent)[-limit:] if limit > 0 else []
+        entries.reverse()
+        return entries
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until every queued entry has been written"""
+        if self._writer is None:
+            return
+        if timeout is None:
+            self._queue.join()
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _start_writer(self):
+        with self._start_lock:
+            if self._writer is not None:
+                return
+            directory = os.path.dirname(self._persist_path)
+            if directory:
+                try:
+                    os.makedirs(directory, exist_ok=True)
+                except OSError:
+                    pass  # Reported by the writer when open() fails
+            self._writer = threading.Thread(
+                target=self._run_writer, name="audit-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _run_writer(self):
+        """Drain the queue in batches, one write per batch"""
+        try:
+            f = open(self._persist_path, "a", encoding="utf-8")
+        except OSError as e:
+            # Read-only or missing filesystem (e.g. the Worker runtime):
+            # keep the log in memory and release anything already queued
+            logger.error(f"Audit log persistence disabled: {e}")
+            self._persist_path = None
+            self._drain()
+            return
+        with f:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    f.write("".join(
+                        json.dumps(entry.to_dict()) + "\n" for entry in batch
+                    ))
+                    f.flush()
+                except Exception as e:
+                    logger.error(f"Failed to write audit entries: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+    def _drain(self):
+        """Discard queued entries, marking them done for flush()"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._queue.task_done()
+
+
+# Global audit log
+_audit_log: Optional[AuditLog] = None
+
+
+def get_audit_log() -> AuditLog:
+    """Get or create global audit log"""
+    global _audit_log
+    if _audit_log is None:
+        _audit_log = AuditLog()
+    return _audit_log
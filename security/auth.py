@@ -9,8 +9,9 @@ Handles:
 - Request context building
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Callable, Awaitable
+from typing import Any, Dict, Hashable, Optional, Callable, Awaitable, Tuple
 from functools import wraps
 import time
 import hashlib
@@ -108,6 +109,41 @@ class AuthContext:
         }
 
 
+class AuthCache:
+    """
+    Bounded TTL memo of access decisions.
+
+    Callers include the policy engine's version in each key, so any policy
+    change makes earlier decisions unreachable; stale entries then age out
+    of the LRU.
+    """
+    
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 30.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at on the monotonic clock, (allowed, reason))
+        self._entries: "OrderedDict[Hashable, Tuple[float, Tuple[bool, str]]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Tuple[bool, str]]:
+        """Cached decision for key, or None if absent/expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+    
+    def put(self, key: Hashable, decision: Tuple[bool, str], ttl: Optional[float] = None):
+        """Cache a decision for `ttl` seconds (default ttl_seconds)"""
+        ttl = self.ttl_seconds if ttl is None else min(ttl, self.ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, decision)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
 class AuthGateway:
     """
     Authentication Gateway - All requests pass through here.
@@ -125,6 +161,9 @@ class AuthGateway:
         
         # Rate limit tracking
         self._rate_limits: Dict[str, Dict] = {}
+        
+        # Memoized check_access decisions
+        self._access_cache = AuthCache()
     
     async def authenticate(
         self,
@@ -257,13 +296,38 @@ class AuthGateway:
         if not context.policy_id:
             return False, "No policy assigned"
         
-        return await self.policy_engine.check_access(
+        engine = self.policy_engine
+        key = (
+            context.policy_id,
+            context.ip_address,
+            resource_type,
+            resource_id,
+            required_level,
+            engine.version,
+        )
+        decision = self._access_cache.get(key)
+        if decision is not None:
+            return decision
+        
+        decision = await engine.check_access(
             context.policy_id,
             resource_type,
             resource_id,
             required_level,
             context={"ip": context.ip_address},
         )
+        
+        # Don't let a cached decision outlive a policy time-window boundary
+        ttl = None
+        policy = await engine.get_policy(context.policy_id)
+        if policy:
+            now = time.time()
+            for bound in (policy.restrictions.valid_from, policy.restrictions.valid_until):
+                if bound and bound > now:
+                    ttl = bound - now if ttl is None else min(ttl, bound - now)
+        self._access_cache.put(key, decision, ttl)
+        
+        return decision
 
     async def authorize(
         self,
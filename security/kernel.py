@@ -75,6 +75,11 @@ class KernelPolicyEnforcer:
         )
         self._policy_engine._policies[p.policy_id] = p
 
+    @property
+    def policy_version(self) -> int:
+        """Changes whenever any policy does; decision caches key on it"""
+        return self._policy_engine.version
+
     def list_kernel_policies(self, active_only: bool = False) -> List[Policy]:
         policies = [
             p
@@ -252,6 +252,13 @@ class PolicyEngine:
         self._policies: Dict[str, Policy] = {}
         self._storage = storage  # Cloudflare D1 adapter
         self._cache: Dict[str, Policy] = {}
+        
+        # Bumped on every policy change; access-decision caches key on it
+        self.version = 0
+    
+    def mark_changed(self):
+        """Record a policy change made outside create/update/delete_policy"""
+        self.version += 1
     
     async def create_policy(
         self,
@@ -272,6 +279,7 @@ class PolicyEngine:
         )
         
         self._policies[policy_id] = policy
+        self.version += 1
         
         # Persist to storage
         if self._storage:
@@ -310,6 +318,7 @@ class PolicyEngine:
                 setattr(policy, key, value)
         
         policy.updated_at = time.time()
+        self.version += 1
         
         if self._storage:
             await self._storage.save_policy(policy)
@@ -320,6 +329,7 @@ class PolicyEngine:
         """Delete a policy"""
         if policy_id in self._policies:
             del self._policies[policy_id]
+            self.version += 1
             
             if self._storage:
                 await self._storage.delete_policy(policy_id)
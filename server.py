@@ -1,7 +1,7 @@
 
 import uvicorn
 import json
-from api.routes import router
+from api.routes import router, encode_json
 from api.middleware import create_middleware_stack
 from core.brain import get_brain
 import asyncio
@@ -30,10 +30,10 @@ async def app(scope, receive, send):
         return
 
     # Create request object
-    from api.routes import Request, HttpMethod, Response
+    from api.routes import Request, Response
     
     path = scope['path']
-    method = HttpMethod(scope['method'])
+    method = scope['method']
     headers = {k.decode(): v.decode() for k, v in scope['headers']}
     query_string = scope['query_string'].decode()
     query = {}
@@ -157,7 +157,7 @@ async def app(scope, receive, send):
         error_msg = response.body.get("error") if isinstance(response.body, dict) else str(response.body)
         final_body = {"success": False, "error": error_msg}
         
-    response_body = json.dumps(final_body).encode()
+    response_body = encode_json(final_body)
     
     await send({
         'type': 'http.response.body',
@@ -166,4 +166,15 @@ async def app(scope, receive, send):
 
 if __name__ == "__main__":
     print("Starting Binetic Python Core on http://0.0.0.0:8000")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http "auto" pick uvloop and httptools when installed (the
+    # "server" extra); a deeper backlog and longer keep-alive spare clients
+    # reconnects under load
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        backlog=4096,
+        timeout_keep_alive=30,
+    )
@@ -0,0 +1,207 @@
+"""API tests aligned with current router and middleware APIs.
+
+These exercise the in-process router only (no HTTP server, no network calls).
+"""
+
+import json
+
+from api.middleware import RateLimitMiddleware, RequestValidationMiddleware
+from api.routes import (
+    HttpMethod,
+    KeyRow,
+    RecallMemoryRequest,
+    Request,
+    Response,
+    Router,
+    encode_json,
+    require_authenticated,
+    require_permission,
+)
+from security.policies import PermissionLevel, ResourceType
+from tests.framework import Assertions, TestCategory, suite, test
+
+api_suite = suite("api", TestCategory.UNIT)
+
+
+def _request(path: str, method: HttpMethod = HttpMethod.GET, **kwargs) -> Request:
+    return Request(method=method, path=path, headers=kwargs.pop("headers", {}), query={}, **kwargs)
+
+
+@test("api", "router_pipeline_short_circuits")
+async def test_router_pipeline_short_circuits(assert_: Assertions):
+    r = Router()
+    calls = []
+
+    async def first(request):
+        calls.append("first")
+        return None
+
+    async def blocker(request):
+        calls.append("blocker")
+        return Response(status=418, body={"error": "blocked"})
+
+    async def never(request):
+        calls.append("never")
+        return None
+
+    @r.route("/ping")
+    async def ping(request):
+        return Response(body={"pong": True})
+
+    r.use(first)
+    r.use(blocker)
+    r.use(never)
+
+    resp = await r.handle(_request("/ping"))
+
+    assert_.equal(resp.status, 418)
+    assert_.equal(calls, ["first", "blocker"])
+
+
+@test("api", "router_pipeline_falls_through_to_handler")
+async def test_router_pipeline_falls_through_to_handler(assert_: Assertions):
+    r = Router()
+
+    async def noop(request):
+        return None
+
+    @r.route("/ping")
+    async def ping(request):
+        return Response(body={"pong": True})
+
+    resp = await r.handle(_request("/ping"))
+    assert_.equal(resp.body, {"pong": True})
+
+    r.use(noop)
+    r.use(noop)
+
+    resp = await r.handle(_request("/ping"))
+    assert_.equal(resp.status, 200)
+    assert_.equal(resp.body, {"pong": True})
+
+
+@test("api", "router_pipeline_accepts_response_subclasses")
+async def test_router_pipeline_accepts_response_subclasses(assert_: Assertions):
+    class Redirect(Response):
+        pass
+
+    r = Router()
+
+    async def redirect(request):
+        return Redirect(status=302)
+
+    r.use(redirect)
+
+    resp = await r.handle(_request("/anywhere"))
+    assert_.equal(resp.status, 302)
+
+
+@test("api", "rate_limit_token_bucket")
+async def test_rate_limit_token_bucket(assert_: Assertions):
+    limiter = RateLimitMiddleware(requests_per_minute=2)
+    req = _request("/api/brain/stats", headers={"CF-Connecting-IP": "10.0.0.1"})
+
+    assert_.none(await limiter(req))
+    assert_.none(await limiter(req))
+
+    blocked = await limiter(req)
+    assert_.not_none(blocked)
+    assert_.equal(blocked.status, 429)
+
+    other = _request("/api/brain/stats", headers={"CF-Connecting-IP": "10.0.0.2"})
+    assert_.none(await limiter(other))
+
+
+@test("api", "rate_limit_bounded_tracking")
+async def test_rate_limit_bounded_tracking(assert_: Assertions):
+    limiter = RateLimitMiddleware(requests_per_minute=5, max_tracked=2)
+
+    for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+        await limiter(_request("/api/brain/stats", headers={"CF-Connecting-IP": ip}))
+
+    assert_.equal(list(limiter._request_counts), ["10.0.0.2", "10.0.0.3"])
+
+    limiter._sweep(limiter._request_counts["10.0.0.3"][1] + limiter.WINDOW_SECONDS + 1)
+    assert_.equal(len(limiter._request_counts), 0)
+
+
+@test("api", "router_param_routes")
+async def test_router_param_routes(assert_: Assertions):
+    r = Router()
+
+    @r.route("/api/operators/:name/invoke", HttpMethod.POST)
+    async def invoke(request):
+        return Response(body={"route": "invoke", "params": request.path_params})
+
+    @r.route("/api/operators/:name", HttpMethod.GET)
+    async def get_op(request):
+        return Response(body={"route": "get"})
+
+    resp = await r.handle(_request("/api/operators/echo/invoke", HttpMethod.POST))
+    assert_.equal(resp.body, {"route": "invoke", "params": {"name": "echo"}})
+
+    resp = await r.handle(_request("/api/operators/echo", HttpMethod.GET))
+    assert_.equal(resp.body, {"route": "get"})
+
+    resp = await r.handle(_request("/api/operators/echo/extra", HttpMethod.GET))
+    assert_.equal(resp.status, 404)
+
+    resp = await r.handle(_request("/api/operators/echo", HttpMethod.DELETE))
+    assert_.equal(resp.status, 404)
+
+
+@test("api", "validation_decodes_json_body")
+async def test_validation_decodes_json_body(assert_: Assertions):
+    validator = RequestValidationMiddleware()
+    headers = {"Content-Type": "application/json; charset=utf-8"}
+
+    for raw in ('{"a": 1}', b'{"a": 1}'):
+        req = _request("/api/memory/store", HttpMethod.POST, headers=dict(headers), body=raw)
+        assert_.none(await validator(req))
+        assert_.equal(req.body, {"a": 1})
+
+    bad = _request("/api/memory/store", HttpMethod.POST, headers=dict(headers), body="{nope")
+    resp = await validator(bad)
+    assert_.equal(resp.status, 400)
+
+
+@test("api", "require_permission_rejects_anonymous")
+async def test_require_permission_rejects_anonymous(assert_: Assertions):
+    calls = []
+
+    @require_permission(ResourceType.KEY, PermissionLevel.READ)
+    async def handler(request):
+        calls.append(request)
+        return Response(body={"ok": True})
+
+    resp = await handler(_request("/api/keys"))
+    assert_.equal(resp.status, 401)
+    assert_.equal(calls, [])
+
+    resp = await require_authenticated(handler)(_request("/api/keys"))
+    assert_.equal(resp.status, 401)
+    assert_.equal(calls, [])
+
+
+@test("api", "encode_json_handles_rows")
+async def test_encode_json_handles_rows(assert_: Assertions):
+    body = {"keys": [KeyRow("key_1", "user", "owner", 1.5, None, "active")]}
+    decoded = json.loads(encode_json(body))
+    assert_.equal(decoded, {"keys": [{
+        "key_id": "key_1",
+        "scope": "user",
+        "owner_id": "owner",
+        "created_at": 1.5,
+        "expires_at": None,
+        "status": "active",
+    }]})
+
+
+@test("api", "request_parse_as_memoizes_model")
+async def test_request_parse_as_memoizes_model(assert_: Assertions):
+    req = _request("/api/memory/recall", HttpMethod.POST, body={"query": "notes", "tags": ["a", "b", "a"]})
+
+    parsed = req.parse_as(RecallMemoryRequest)
+    assert_.equal(parsed.tags, frozenset({"a", "b"}))
+    assert_.equal(parsed.limit, 10)
+    assert_.true(req.parse_as(RecallMemoryRequest) is parsed)
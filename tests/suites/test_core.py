@@ -3,12 +3,20 @@
 These are intentionally minimal and avoid external network calls.
 """
 
+import asyncio
+import json
+import os
+import random
+import tempfile
+
 from tests.framework import test, suite, TestCategory, Assertions
 
 from core.operators import OperatorRegistry, OperatorType, OperatorSignature, OperatorPipeline
-from core.memtools import MemtoolRegistry
-from core.discovery import DiscoveryEngine, DiscoverySource, DiscoveryMethod
+from core.memtools import NUMPY_AVAILABLE, Memory, MemtoolRegistry
+from core.discovery import Capability, CapabilityType, DiscoveryEngine, DiscoverySource, DiscoveryMethod
 from core.network import EmergentNetwork, Signal, SignalType
+from core.brain import Brain, Thought, ThoughtType, _StoreBatcher, _classify_capability_name
+from core.query_cache import QueryCache, SemanticQueryCache
 
 
 core_suite = suite("core", TestCategory.UNIT)
@@ -16,24 +24,38 @@ core_suite = suite("core", TestCategory.UNIT)
 
 @test("core", "operator_register_and_get")
 async def test_operator_register_and_get(assert_: Assertions):
-    registry = OperatorRegistry()
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = OperatorRegistry(persist_path=os.path.join(tmp, "operators.json"))
+
+        sig = OperatorSignature(
+            operator_id="op_test_1",
+            operator_type=OperatorType.COMPUTE,
+            endpoint_url="https://example.com/api",
+            method="POST",
+            headers={},
+            request_template={},
+            required_params=[],
+            optional_params=[],
+        )
 
-    sig = OperatorSignature(
-        operator_id="op_test_1",
-        operator_type=OperatorType.COMPUTE,
-        endpoint_url="https://example.com/api",
-        method="POST",
-        headers={},
-        request_template={},
-        required_params=[],
-        optional_params=[],
-    )
+        await registry.register(sig)
+        got = await registry.get("op_test_1")
 
-    await registry.register(sig)
-    got = await registry.get("op_test_1")
+        assert_.not_none(got)
+        assert_.equal(got.operator_id, "op_test_1")
 
-    assert_.not_none(got)
-    assert_.equal(got.operator_id, "op_test_1")
+        batch = [
+            OperatorSignature(
+                operator_id=f"op_test_batch_{i}",
+                operator_type=OperatorType.SEARCH,
+                endpoint_url="https://example.com/search",
+                method="GET",
+            )
+            for i in range(2)
+        ]
+        await registry.register_many(batch)
+        ids = [op.operator_id for op in await registry.get_by_type(OperatorType.SEARCH)]
+        assert_.equal(sorted(ids), ["op_test_batch_0", "op_test_batch_1"])
 
 
 @test("core", "operator_invoke_missing")
@@ -67,6 +89,107 @@ async def test_memtools_store_and_recall(assert_: Assertions):
     assert_.equal(recalled[0].memory_id, stored.memory_id)
 
 
+@test("core", "memtools_match_patterns_equality_and_regex")
+async def test_memtools_match_patterns_equality_and_regex(assert_: Assertions):
+    mem = MemtoolRegistry()
+
+    exact = await mem.recognize_pattern("route", {"intent": "search", "source": "api"})
+    regex = await mem.recognize_pattern("route", {"intent": {"$regex": "^sea"}})
+
+    matched = await mem.match_patterns({"intent": "search", "source": "api"})
+    assert_.equal({p.pattern_id for p in matched}, {exact.pattern_id, regex.pattern_id})
+
+    matched = await mem.match_patterns({"intent": "seal"})
+    assert_.equal([p.pattern_id for p in matched], [regex.pattern_id])
+
+    assert_.equal(await mem.match_patterns({"source": "api"}), [])
+
+
+@test("core", "memtools_semantic_recall_matches_flat_scan")
+async def test_memtools_semantic_recall_matches_flat_scan(assert_: Assertions):
+    async def embed(text):
+        return [float(ord(c)) for c in text.ljust(8)[:8]]
+
+    mem = MemtoolRegistry(embedder=embed)
+    mem.ANN_MIN_MEMORIES = 8  # exercise the HNSW path when hnswlib is installed
+    for word in ("alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota"):
+        await mem.store(word)
+
+    query = await embed("gamma")
+    recalled = await mem.recall(query="gamma", limit=3)
+    expected = mem._semantic_sort(list(mem._memories.values()), query)[:3]
+
+    assert_.equal([m.content for m in recalled], [m.content for m in expected])
+
+    # Filtered candidate sets take the (NumPy-vectorized when available) scan
+    subset = list(mem._memories.values())[::2]
+    assert_.equal(
+        [m.content for m in mem._semantic_top(subset, query, 3)],
+        [m.content for m in mem._semantic_sort(subset, query)[:3]],
+    )
+
+    # Memories without an embedding stay on the vectorized scan, scoring 0
+    subset.insert(1, Memory(memory_id="bare", content="bare"))
+    assert_.equal(
+        [m.content for m in mem._semantic_top(subset, query, len(subset))],
+        [m.content for m in mem._semantic_sort(subset, query)],
+    )
+
+
+@test("core", "memtools_ivf_pq_recall_reranks_exactly")
+async def test_memtools_ivf_pq_recall_reranks_exactly(assert_: Assertions):
+    if not NUMPY_AVAILABLE:
+        return
+
+    async def embed(text):
+        rng = random.Random(text)
+        return [rng.uniform(-1.0, 1.0) for _ in range(32)]
+
+    mem = MemtoolRegistry(embedder=embed)
+    mem.ANN_MIN_MEMORIES = 10 ** 9  # keep recall on the flat scan
+    mem.PQ_TRAIN_MEMORIES = 64
+    mem.IVF_PROBES = 2
+    for i in range(80):
+        await mem.store(f"memory {i}")
+
+    assert_.true(mem._pq is not None)
+    assert_.equal(mem._emb_codes.dtype.name, "uint8")
+    assert_.equal(mem._ivf.partitions, 8)
+
+    # Probing its own partition and reranking exactly finds the memory first
+    recalled = await mem.recall(query="memory 42", limit=1)
+    assert_.equal(recalled[0].content, "memory 42")
+
+
+@test("core", "query_cache_lru_and_ttl")
+async def test_query_cache_lru_and_ttl(assert_: Assertions):
+    cache = QueryCache(max_size=2, ttl_seconds=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert_.equal(cache.get("a"), 1)
+
+    cache.put("c", 3)  # evicts "b", the least recently used
+    assert_.none(cache.get("b"))
+    assert_.equal(cache.get("c"), 3)
+
+    expired = QueryCache(ttl_seconds=0.0)
+    expired.put("a", 1)
+    assert_.none(expired.get("a"))
+
+    cache.invalidate_all()
+    assert_.equal(cache.stats()["size"], 0)
+
+
+@test("core", "semantic_query_cache_matches_near_queries")
+async def test_semantic_query_cache_matches_near_queries(assert_: Assertions):
+    cache = SemanticQueryCache(initial_threshold=0.05)
+    cache.put("scope", [1.0, 0.0, 0.01], "notes")
+
+    assert_.equal(cache.get("scope", [1.0, 0.0, 0.02]), "notes")
+    assert_.none(cache.get("scope", [0.0, 1.0, 0.0]))
+    assert_.none(cache.get("other", [1.0, 0.0, 0.02]))
+
+
 @test("core", "discovery_no_http_client_returns_empty")
 async def test_discovery_no_http_client_returns_empty(assert_: Assertions):
     eng = DiscoveryEngine(http_client=None)
@@ -86,6 +209,118 @@ async def test_discovery_no_http_client_returns_empty(assert_: Assertions):
     assert_.equal(out["s1"], [])
 
 
+@test("core", "discovery_search_uses_indices_and_healthy_cache")
+async def test_discovery_search_uses_indices_and_healthy_cache(assert_: Assertions):
+    class _Http:
+        status_code = 200
+
+        async def request(self, method, url, timeout=None):
+            return self
+
+    http = _Http()
+    eng = DiscoveryEngine(http_client=http)
+    for cap_id, cap_type in (("c1", CapabilityType.REST_API), ("c2", CapabilityType.TOOL)):
+        eng._register_capability(Capability(
+            capability_id=cap_id,
+            name=cap_id,
+            capability_type=cap_type,
+            endpoint=f"https://example.com/{cap_id}",
+            tags={cap_id, "shared"},
+        ))
+
+    healthy = eng.search_capabilities(healthy_only=True)
+    assert_.equal([c.capability_id for c in healthy], ["c1", "c2"])
+    assert_.true(eng.search_capabilities(healthy_only=True) is healthy)
+
+    version = eng.version
+    http.status_code = 503
+    await eng.health_check("c1")
+    assert_.true(eng.version > version)
+    assert_.equal([c.capability_id for c in eng.search_capabilities(healthy_only=True)], ["c2"])
+    assert_.equal(eng.stats()["healthy_capabilities"], 1)
+    assert_.equal(eng.stats()["by_type"][CapabilityType.TOOL.value], 1)
+
+    tools = eng.search_capabilities(capability_type=CapabilityType.TOOL, tags={"shared"})
+    assert_.equal([c.capability_id for c in tools], ["c2"])
+    assert_.equal([c.capability_id for c in eng.search_capabilities(tags={"c2", "c1"})], ["c1", "c2"])
+    assert_.equal(eng.search_capabilities(capability_type=CapabilityType.TOOL, tags={"c1"}), [])
+
+
+@test("core", "discovery_caches_kernel_register_decisions")
+async def test_discovery_caches_kernel_register_decisions(assert_: Assertions):
+    from security.kernel import get_kernel_enforcer
+
+    enforcer = get_kernel_enforcer()
+    original = enforcer.enforce_discovery_register
+    calls = []
+
+    async def counting(**kwargs):
+        calls.append(kwargs)
+        return await original(**kwargs)
+
+    source = DiscoverySource(
+        source_id="mcp1",
+        name="Tools",
+        base_url="https://example.com/mcp",
+        discovery_method=DiscoveryMethod.MCP,
+    )
+    eng = DiscoveryEngine(http_client=None)
+
+    async def tools(_source):
+        return [
+            Capability(
+                capability_id=f"mcp-mcp1-{name}",
+                name=name,
+                capability_type=CapabilityType.TOOL,
+                endpoint=_source.base_url,
+                method="MCP",
+            )
+            for name in ("a", "b", "c")
+        ]
+
+    eng._discover_mcp = tools
+    enforcer.enforce_discovery_register = counting
+    try:
+        found = await eng.discover_from_source(source)
+        await eng.discover_from_source(source)
+    finally:
+        del enforcer.enforce_discovery_register
+
+    assert_.equal(len(found), 3)
+    assert_.equal(len(eng.search_capabilities(capability_type=CapabilityType.TOOL)), 3)
+    assert_.equal(len(calls), 1)
+
+
+@test("core", "discovery_reuses_unchanged_manifest")
+async def test_discovery_reuses_unchanged_manifest(assert_: Assertions):
+    import httpx
+
+    body = json.dumps({"capabilities": [{"name": "lookup", "type": "function"}]}).encode()
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+
+    eng = DiscoveryEngine(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    source = DiscoverySource(
+        source_id="m1",
+        name="Manifest",
+        base_url="https://example.com",
+        discovery_method=DiscoveryMethod.MANIFEST,
+        discovery_path="/manifest.json",
+    )
+
+    first = await eng._discover_manifest(source)
+    second = await eng._discover_manifest(source)
+
+    assert_.equal(seen, [None, '"v1"'])
+    assert_.equal([c.name for c in second], ["lookup"])
+    assert_.true(second[0] is first[0])
+
+
 @test("core", "network_create_and_connect")
 async def test_network_create_and_connect(assert_: Assertions):
     net = EmergentNetwork()
@@ -119,3 +354,141 @@ async def test_network_send_signal_to_target(assert_: Assertions):
     assert_.equal(len(net.slots[tgt.slot_id].signal_queue), 1)
     assert_.equal(net.slots[tgt.slot_id].signal_queue[0].signal_id, "sig_test")
 
+
+
+@test("core", "network_send_signals_batch")
+async def test_network_send_signals_batch(assert_: Assertions):
+    net = EmergentNetwork()
+
+    src = await net.create_slot(slot_type="test")
+    tgt = await net.create_slot(slot_type="test")
+
+    signals = [
+        Signal(
+            signal_id=f"sig_{i}",
+            signal_type=SignalType.QUERY,
+            source_slot=src.slot_id,
+            target_slot=tgt.slot_id,
+            payload={"i": i},
+        )
+        for i in range(3)
+    ]
+
+    ids = await net.send_signals(signals)
+
+    assert_.equal(ids, ["sig_0", "sig_1", "sig_2"])
+    assert_.equal(len(net.slots[tgt.slot_id].signal_queue), 3)
+
+
+@test("core", "network_delivers_signals_on_enqueue")
+async def test_network_delivers_signals_on_enqueue(assert_: Assertions):
+    net = EmergentNetwork()
+
+    src = await net.create_slot(slot_type="test")
+    tgt = await net.create_slot(slot_type="test")
+    seen = []
+    await net.add_binding(tgt.slot_id, {}, "transform", {"transform": lambda p: seen.append(p) or p})
+
+    await net.start()
+    try:
+        await net.send_signals([
+            Signal(
+                signal_id=f"sig_{i}",
+                signal_type=SignalType.QUERY,
+                source_slot=src.slot_id,
+                target_slot=tgt.slot_id,
+                payload={"i": i},
+            )
+            for i in range(3)
+        ])
+        for _ in range(5):
+            await asyncio.sleep(0)
+    finally:
+        await net.stop()
+
+    assert_.equal(seen, [{"i": 0}, {"i": 1}, {"i": 2}])
+    assert_.equal(len(net.slots[tgt.slot_id].signal_queue), 0)
+
+
+@test("core", "capability_names_classify_by_keyword")
+async def test_capability_names_classify_by_keyword(assert_: Assertions):
+    assert_.equal(_classify_capability_name("getUser"), (OperatorType.RETRIEVE, False))
+    assert_.equal(_classify_capability_name("upload-file"), (OperatorType.STORE, True))
+    # Earlier rules win, and keywords only match whole words
+    assert_.equal(_classify_capability_name("store_and_find"), (OperatorType.SEARCH, False))
+    assert_.equal(_classify_capability_name("target_list"), (OperatorType.COMPUTE, True))
+
+
+@test("core", "store_batcher_coalesces_concurrent_stores")
+async def test_store_batcher_coalesces_concurrent_stores(assert_: Assertions):
+    mem = MemtoolRegistry()
+    batches = []
+    store_many = mem.store_many
+
+    async def recording_store_many(items, return_exceptions=False):
+        batches.append(len(items))
+        return await store_many(items, return_exceptions=return_exceptions)
+
+    mem.store_many = recording_store_many
+    batcher = _StoreBatcher(mem)
+
+    memories = await asyncio.gather(*(
+        batcher.submit(content=f"note {i}", tags={"note"}) for i in range(5)
+    ))
+    await batcher.stop()
+
+    assert_.equal(batches, [5])
+    assert_.equal([m.content for m in memories], [f"note {i}" for i in range(5)])
+    assert_.equal(len(await mem.recall(tags={"note"})), 5)
+
+
+@test("core", "brain_submit_batches_queued_thoughts")
+async def test_brain_submit_batches_queued_thoughts(assert_: Assertions):
+    with tempfile.TemporaryDirectory() as tmp:
+        operators = OperatorRegistry(persist_path=os.path.join(tmp, "operators.json"))
+        brain = Brain(
+            operators=operators,
+            network=EmergentNetwork(operators),
+            memtools=MemtoolRegistry(),
+            discovery=DiscoveryEngine(),
+        )
+        in_flight = []
+        peak = []
+
+        async def recording_think(thought):
+            in_flight.append(thought)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(thought)
+            return thought.content
+
+        brain.think = recording_think
+        thoughts = [
+            Thought(thought_id=f"t{i}", thought_type=ThoughtType.QUERY, content=i)
+            for i in range(6)
+        ]
+
+        results = await asyncio.gather(*(brain.submit(t) for t in thoughts))
+        await brain._stop_thought_workers()
+
+    assert_.equal(results, list(range(6)))
+    assert_.true(max(peak) > 1)
+
+
+@test("core", "store_batcher_stop_fails_in_flight_stores")
+async def test_store_batcher_stop_fails_in_flight_stores(assert_: Assertions):
+    mem = MemtoolRegistry()
+    flushing = asyncio.Event()
+
+    async def slow_store_many(items, return_exceptions=False):
+        flushing.set()
+        await asyncio.sleep(60)
+
+    mem.store_many = slow_store_many
+    batcher = _StoreBatcher(mem)
+
+    future = batcher.submit(content="note")
+    await flushing.wait()
+    await batcher.stop()
+
+    assert_.true(future.cancelled())
@@ -3,13 +3,17 @@
 These tests focus on in-memory behavior (no external storage adapters).
 """
 
+import json
+import os
+import tempfile
 import time
 
 from tests.framework import test, suite, TestCategory, Assertions
 
 from security.policies import PolicyEngine, Permission, PermissionLevel, ResourceType
 from security.keys import KeyManager, KeyScope, KeyStatus
-from security.auth import AuthGateway, AuthToken
+from security.auth import AuthContext, AuthGateway, AuthToken
+from security.audit import AuditEntry, AuditLog
 
 
 security_suite = suite("security", TestCategory.SECURITY)
@@ -44,6 +48,26 @@ async def test_policy_engine_create_and_check_access(assert_: Assertions):
     assert_.false(denied)
 
 
+@test("security", "gateway_access_cache_follows_policy_changes")
+async def test_gateway_access_cache_follows_policy_changes(assert_: Assertions):
+    engine = PolicyEngine()
+    gateway = AuthGateway(key_manager=KeyManager(), policy_engine=engine)
+
+    policy = await engine.create_policy(
+        name="Cached Policy",
+        permissions=[Permission(ResourceType.SLOT, None, PermissionLevel.READ)],
+        created_by="tests",
+    )
+    context = AuthContext(authenticated=True, policy_id=policy.policy_id)
+
+    allowed, _ = await gateway.check_access(context, ResourceType.SLOT, "slot_1", PermissionLevel.READ)
+    assert_.true(allowed)
+
+    await engine.update_policy(policy.policy_id, {"is_active": False})
+    allowed, _ = await gateway.check_access(context, ResourceType.SLOT, "slot_1", PermissionLevel.READ)
+    assert_.false(allowed)
+
+
 @test("security", "key_lifecycle_create_verify_revoke")
 async def test_key_lifecycle_create_verify_revoke(assert_: Assertions):
     manager = KeyManager()
@@ -154,3 +178,38 @@ async def test_auth_gateway_bearer_token(assert_: Assertions):
     ctx = await gateway.authenticate(bearer_token=tok.encode(secret="test-secret"))
     assert_.true(ctx.authenticated)
     assert_.equal(ctx.owner_id, "token_owner")
+
+
+@test("security", "audit_log_batches_to_file")
+async def test_audit_log_batches_to_file(assert_: Assertions):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "audit", "audit.jsonl")
+        log = AuditLog(persist_path=path, batch_size=4)
+
+        for i in range(10):
+            log.record(AuditEntry("memory", f"m{i}", "READ", allowed=i % 2 == 0))
+        log.flush(timeout=5)
+
+        with open(path) as f:
+            rows = [json.loads(line) for line in f]
+
+        assert_.equal([r["resource_id"] for r in rows], [f"m{i}" for i in range(10)])
+        assert_.equal([e.resource_id for e in log.recent(2)], ["m9", "m8"])
+
+
+@test("security", "audit_log_falls_back_to_memory_when_unwritable")
+async def test_audit_log_falls_back_to_memory_when_unwritable(assert_: Assertions):
+    with tempfile.TemporaryDirectory() as tmp:
+        blocker = os.path.join(tmp, "not_a_dir")
+        open(blocker, "w").close()
+        log = AuditLog(persist_path=os.path.join(blocker, "audit.jsonl"))
+
+        for i in range(3):
+            log.record(AuditEntry("memory", f"m{i}", "READ", allowed=True))
+        log._writer.join(timeout=5)
+        log.flush()
+        log.record(AuditEntry("memory", "m3", "READ", allowed=True))
+        log.flush()
+
+        assert_.none(log._persist_path)
+        assert_.equal([e.resource_id for e in log.recent(2)], ["m3", "m2"])